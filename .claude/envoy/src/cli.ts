@@ -9,6 +9,14 @@
 import { Command } from "commander";
 import { discoverCommands } from "./commands/index.js";
 
+/**
+ * Write a command result to stdout as indented JSON in a single write,
+ * bypassing console.log's argument formatting.
+ */
+function writeResult(result: unknown): void {
+  process.stdout.write(`${JSON.stringify(result, null, 2)}\n`);
+}
+
 async function getInfo(
   commands: Map<string, Record<string, unknown>>
 ): Promise<Record<string, unknown>> {
@@ -45,7 +53,13 @@ async function main(): Promise<void> {
     .description("CLI for agent-scoped external tool access")
     .version("0.1.0");
 
-  const commands = await discoverCommands();
+  // Import only the invoked group's module (and its SDKs); info, help and
+  // unknown groups fall back to loading every command module
+  const requestedGroup = process.argv[2];
+  let commands = await discoverCommands(requestedGroup);
+  if (requestedGroup && commands.size === 0) {
+    commands = await discoverCommands();
+  }
 
   // Register discovered command groups
   for (const [groupName, subcommands] of commands) {
@@ -88,22 +102,16 @@ async function main(): Promise<void> {
         try {
           // Use instrumented execution
           const result = await cmd.executeWithLogging(args, agent);
-          console.log(JSON.stringify(result, null, 2));
+          writeResult(result);
         } catch (e) {
-          console.log(
-            JSON.stringify(
-              {
-                status: "error",
-                error: {
-                  type: "execution_error",
-                  message: e instanceof Error ? e.message : String(e),
-                  command: `${groupName} ${subcmdName}`,
-                },
-              },
-              null,
-              2
-            )
-          );
+          writeResult({
+            status: "error",
+            error: {
+              type: "execution_error",
+              message: e instanceof Error ? e.message : String(e),
+              command: `${groupName} ${subcmdName}`,
+            },
+          });
           process.exit(1);
         }
       });
@@ -116,7 +124,7 @@ async function main(): Promise<void> {
     .description("Show available commands and API status")
     .action(async () => {
       const result = await getInfo(commands);
-      console.log(JSON.stringify(result, null, 2));
+      writeResult(result);
     });
 
   // Handle no command
@@ -26,6 +26,7 @@
 
 import { Command } from "commander";
 import { readFileSync } from "fs";
+import { readFile as readFileAsync } from "fs/promises";
 import {
   logCommandStart,
   logCommandComplete,
@@ -195,27 +196,40 @@ export abstract class BaseCommand {
   }
 
   /**
-   * Read a file, return null if not found.
+   * Read a file as raw bytes, return null if not found.
+   * Skips decoding for callers that hash, scan, or base64 the content.
    */
-  protected readFile(path: string): string | null {
+  protected readBytes(path: string): Buffer | null {
     try {
-      return readFileSync(path, "utf-8");
+      return readFileSync(path);
     } catch {
       return null;
     }
   }
 
   /**
-   * Read multiple files, return {path: content} for existing files.
+   * Read a file, return null if not found.
    */
-  protected readFiles(paths: string[]): Record<string, string> {
+  protected readFile(path: string): string | null {
+    const bytes = this.readBytes(path);
+    return bytes === null ? null : bytes.toString("utf-8");
+  }
+
+  /**
+   * Read multiple files concurrently, return {path: content} for existing files.
+   * Keys keep the order of the input paths.
+   */
+  protected async readFiles(paths: string[]): Promise<Record<string, string>> {
+    const contents = await Promise.all(
+      paths.map((path) => readFileAsync(path, "utf-8").catch(() => null))
+    );
     const result: Record<string, string> = {};
-    for (const path of paths) {
-      const content = this.readFile(path);
+    paths.forEach((path, i) => {
+      const content = contents[i];
       if (content !== null) {
         result[path] = content;
       }
-    }
+    });
     return result;
   }
 }
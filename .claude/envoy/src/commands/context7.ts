@@ -6,15 +6,29 @@
 
 import { Command } from "commander";
 import { BaseCommand, type CommandResult } from "./base.js";
-import { Context7, Context7Error, type Library } from "@upstash/context7-sdk";
+import type { Context7, Library } from "@upstash/context7-sdk";
+
+type Context7Sdk = typeof import("@upstash/context7-sdk");
+
+/** SDK module, loaded on first use so other envoy commands skip the import */
+let context7Sdk: Context7Sdk | null = null;
+
+/**
+ * Load the Context7 SDK once per process.
+ */
+async function loadContext7Sdk(): Promise<Context7Sdk> {
+  context7Sdk ??= await import("@upstash/context7-sdk");
+  return context7Sdk;
+}
 
 /** Shared base for Context7 commands - DRY for auth + error handling */
 abstract class Context7BaseCommand extends BaseCommand {
-  protected requireApiKey(): CommandResult | Context7 {
+  protected async requireApiKey(): Promise<CommandResult | Context7> {
     const apiKey = process.env.CONTEXT7_API_KEY;
     if (!apiKey) {
       return this.error("auth_error", "CONTEXT7_API_KEY not set");
     }
+    const { Context7 } = await loadContext7Sdk();
     return new Context7({ apiKey });
   }
 
@@ -28,7 +42,7 @@ abstract class Context7BaseCommand extends BaseCommand {
   }
 
   protected handleError(e: unknown, extraHint?: string): CommandResult {
-    if (e instanceof Context7Error) {
+    if (context7Sdk && e instanceof context7Sdk.Context7Error) {
       return this.error("api_error", e.message, extraHint);
     }
     if (e instanceof Error && e.message.includes("timeout")) {
@@ -50,7 +64,7 @@ class Context7SearchCommand extends Context7BaseCommand {
   }
 
   async execute(args: Record<string, unknown>): Promise<CommandResult> {
-    const clientOrError = this.requireApiKey();
+    const clientOrError = await this.requireApiKey();
     if ("status" in clientOrError) return clientOrError;
 
     const library = args.library as string;
@@ -109,7 +123,7 @@ class Context7ContextCommand extends Context7BaseCommand {
   }
 
   async execute(args: Record<string, unknown>): Promise<CommandResult> {
-    const clientOrError = this.requireApiKey();
+    const clientOrError = await this.requireApiKey();
     if ("status" in clientOrError) return clientOrError;
 
     const libraryId = args.libraryId as string;
@@ -9,7 +9,7 @@
  */
 
 import { Command } from "commander";
-import { execSync, spawnSync } from "child_process";
+import { execFileSync, spawnSync } from "child_process";
 import { existsSync, readFileSync, readdirSync, statSync } from "fs";
 import { join, relative, extname, dirname } from "path";
 import matter from "gray-matter";
@@ -22,7 +22,7 @@ import { getSupportedExtensions } from "../lib/ast-queries.js";
 
 const getProjectRoot = (): string => {
   try {
-    return execSync("git rev-parse --show-toplevel", { encoding: "utf-8" }).trim();
+    return execFileSync("git", ["rev-parse", "--show-toplevel"], { encoding: "utf-8" }).trim();
   } catch {
     return process.cwd();
   }
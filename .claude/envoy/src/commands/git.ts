@@ -14,7 +14,7 @@
 import { spawnSync } from "child_process";
 import { Command } from "commander";
 import { BaseCommand, type CommandResult } from "./base.js";
-import { getBaseBranch, getBranch } from "../lib/git.js";
+import { clearBranchCache, getBaseBranch, getBranch } from "../lib/git.js";
 import { readPrompt, writePrompt, getPromptId } from "../lib/index.js";
 
 interface ChangedFile {
@@ -129,16 +129,48 @@ function parseWorktrees(): WorktreeInfo[] {
 }
 
 /**
- * Get last commit date for a branch.
+ * Get last commit date for every local branch in one git call.
  */
-function getLastCommitDate(branch: string): string | undefined {
+function getLastCommitDates(): Map<string, string> {
+  const dates = new Map<string, string>();
   const { success, stdout } = runGit([
-    "log",
-    "-1",
-    "--format=%ci",
-    branch,
+    "for-each-ref",
+    "--format=%(refname:short)%09%(committerdate:iso)",
+    "refs/heads",
   ]);
-  return success ? stdout : undefined;
+  if (!success) return dates;
+
+  for (const line of stdout.split("\n")) {
+    const tab = line.indexOf("\t");
+    if (tab > 0) {
+      dates.set(line.substring(0, tab), line.substring(tab + 1));
+    }
+  }
+  return dates;
+}
+
+/**
+ * Get the set of local branches merged into base.
+ */
+function getMergedBranches(baseBranch: string): Set<string> {
+  const { success, stdout } = runGit([
+    "for-each-ref",
+    `--merged=${baseBranch}`,
+    "--format=%(refname:short)",
+    "refs/heads",
+  ]);
+  return new Set(success ? stdout.split("\n").filter(Boolean) : []);
+}
+
+/**
+ * Delete several branches with a single git invocation.
+ * Returns git's per-branch error lines (empty on success).
+ */
+function deleteBranches(branches: string[], force: boolean): string[] {
+  if (branches.length === 0) return [];
+  const { success, stderr } = runGit(["branch", force ? "-D" : "-d", ...branches]);
+  if (success) return [];
+  return stderr.split("\n").filter((line) => line.startsWith("error:"));
 }
 
 // ============================================================================
@@ -218,6 +250,7 @@ class CheckoutBaseCommand extends BaseCommand {
     const baseBranch = getBaseBranch();
 
     const { success, stderr } = runGit(["checkout", baseBranch]);
+    clearBranchCache();
 
     if (!success) {
       return this.error("checkout_failed", `Failed to checkout ${baseBranch}: ${stderr}`);
@@ -402,38 +435,33 @@ class CleanupWorktreesCommand extends BaseCommand {
     const orphaned: WorktreeInfo[] = [];
     const kept: string[] = [];
     const errors: string[] = [];
+    const mergedBranches: string[] = [];
+    const orphanBranches: string[] = [];
+
+    // Query merged status and commit dates once rather than per worktree
+    const mergedBranchSet = implWorktrees.length > 0 ? getMergedBranches(baseBranch) : new Set<string>();
+    const lastCommitDates = implWorktrees.length > 0 ? getLastCommitDates() : undefined;
 
     // Check merged status for each worktree
     for (const wt of implWorktrees) {
-      // Check if branch is merged into base
-      const mergeCheck = runGit(["branch", "--merged", baseBranch]);
-      const isMerged = mergeCheck.success &&
-        mergeCheck.stdout.split("\n").some((b) => b.trim() === wt.branch);
-
-      if (isMerged) {
+      if (mergedBranchSet.has(wt.branch)) {
         // Branch is merged - clean it up
         if (!dryRun) {
-          // Remove worktree
+          // Remove worktree (branch deletion is batched below)
           const removeWt = runGit(["worktree", "remove", wt.path, "--force"]);
           if (!removeWt.success) {
             errors.push(`Failed to remove worktree ${wt.path}: ${removeWt.stderr}`);
             continue;
           }
-
-          // Delete branch
-          const removeBranch = runGit(["branch", "-d", wt.branch]);
-          if (!removeBranch.success) {
-            errors.push(`Failed to delete branch ${wt.branch}: ${removeBranch.stderr}`);
-          }
+          mergedBranches.push(wt.branch);
         }
         cleaned.push(wt.branch);
       } else {
         // Check if orphaned (no matching prompt in plan directory)
         // For now, mark as orphaned if not merged
-        const lastCommit = getLastCommitDate(wt.branch);
         orphaned.push({
           ...wt,
-          lastCommitDate: lastCommit,
+          lastCommitDate: lastCommitDates?.get(wt.branch),
         });
       }
     }
@@ -444,7 +472,7 @@ class CleanupWorktreesCommand extends BaseCommand {
         // Force delete
         const removeWt = runGit(["worktree", "remove", wt.path, "--force"]);
         if (removeWt.success) {
-          const removeBranch = runGit(["branch", "-D", wt.branch]);
+          orphanBranches.push(wt.branch);
           cleaned.push(wt.branch);
         } else {
           errors.push(`Failed to remove orphaned worktree ${wt.path}: ${removeWt.stderr}`);
@@ -455,6 +483,12 @@ class CleanupWorktreesCommand extends BaseCommand {
       }
     }
 
+    // Delete branches of removed worktrees in one git call per mode
+    for (const line of deleteBranches(mergedBranches, false)) {
+      errors.push(`Failed to delete branch: ${line}`);
+    }
+    deleteBranches(orphanBranches, true);
+
     return this.success({
       cleaned,
       orphaned: orphaned.map((wt) => ({
@@ -20,28 +20,31 @@ export interface CommandModule {
  * Supports:
  * - Single-file modules: foo.ts -> import ./foo.js
  * - Directory modules: foo/index.ts -> import ./foo/index.js
+ *
+ * When group is given, only that module is imported (empty map if none matches).
  */
-export async function discoverCommands(): Promise<
+export async function discoverCommands(group?: string): Promise<
   Map<string, Record<string, CommandClass>>
 > {
   const commands = new Map<string, Record<string, CommandClass>>();
+  const modules: Array<{ moduleName: string; importPath: string }> = [];
 
   const entries = readdirSync(__dirname);
 
   for (const entry of entries) {
+    if (group !== undefined && entry !== group && entry !== `${group}.ts`) {
+      continue;
+    }
+
     const entryPath = join(__dirname, entry);
     const stat = statSync(entryPath);
 
-    let moduleName: string;
-    let importPath: string;
-
     if (stat.isDirectory()) {
       // Directory module: check for index.ts
       const indexPath = join(entryPath, "index.ts");
       try {
         statSync(indexPath);
-        moduleName = entry;
-        importPath = `./${entry}/index.js`;
+        modules.push({ moduleName: entry, importPath: `./${entry}/index.js` });
       } catch {
         // No index.ts, skip this directory
         continue;
@@ -52,22 +55,31 @@ export async function discoverCommands(): Promise<
       !entry.startsWith("index")
     ) {
       // Single-file module
-      moduleName = entry.replace(".ts", "");
-      importPath = `./${moduleName}.js`;
-    } else {
-      continue;
+      const moduleName = entry.replace(".ts", "");
+      modules.push({ moduleName, importPath: `./${moduleName}.js` });
     }
+  }
 
-    try {
-      const module = (await import(importPath)) as CommandModule;
-      if (module.COMMANDS && Object.keys(module.COMMANDS).length > 0) {
-        commands.set(moduleName, module.COMMANDS);
+  // Load modules concurrently so their file reads and transforms overlap
+  const loaded = await Promise.all(
+    modules.map(async ({ moduleName, importPath }) => {
+      try {
+        return (await import(importPath)) as CommandModule;
+      } catch (e) {
+        // Skip modules with missing dependencies or errors
+        console.error(`Warning: Could not load ${moduleName}: ${e}`);
+        return null;
       }
-    } catch (e) {
-      // Skip modules with missing dependencies or errors
-      console.error(`Warning: Could not load ${moduleName}: ${e}`);
+    })
+  );
+
+  // Register in directory order, independent of load completion order
+  modules.forEach(({ moduleName }, idx) => {
+    const module = loaded[idx];
+    if (module?.COMMANDS && Object.keys(module.COMMANDS).length > 0) {
+      commands.set(moduleName, module.COMMANDS);
     }
-  }
+  });
 
   return commands;
 }
@@ -6,8 +6,7 @@
 import { Command } from "commander";
 import { readFileSync, existsSync } from "fs";
 import { join, extname } from "path";
-import { spawnSync } from "child_process";
-import { getBaseBranch, getBranch, getDiff, getPlanDir, isDirectModeBranch } from "../lib/git.js";
+import { getBaseBranch, getBranch, getDiff, getPlanDir, isDirectModeBranch, runGitAsync } from "../lib/git.js";
 import {
   readPlan,
   readAllPrompts,
@@ -36,11 +35,16 @@ import {
   type LLMProvider,
   type ProviderName,
   type ContentPart,
+  type GenerateResult,
 } from "../lib/providers.js";
+import { readCachedResponse, responseCacheKey, writeCachedResponse } from "../lib/response-cache.js";
 import { BaseCommand, type CommandResult } from "./base.js";
 
 const DEFAULT_BLOCKING_GATE_TIMEOUT_MS = 12 * 60 * 60 * 1000;
 
+/** Diff characters included in review prompts */
+const MAX_REVIEW_DIFF_LENGTH = 50000;
+
 function getBlockingGateTimeout(): number {
   const envTimeout = process.env.BLOCKING_GATE_TIMEOUT_MS;
   if (envTimeout) {
@@ -52,11 +56,16 @@ function getBlockingGateTimeout(): number {
   return DEFAULT_BLOCKING_GATE_TIMEOUT_MS;
 }
 
+/**
+ * Parse the JSON object in an LLM response (first "{" through last "}").
+ * Located with indexOf/lastIndexOf rather than a greedy regex over the whole response.
+ */
 function parseJsonResponse(response: string): Record<string, unknown> {
-  const jsonMatch = response.match(/\{[\s\S]*\}/);
-  if (jsonMatch) {
+  const start = response.indexOf("{");
+  const end = response.lastIndexOf("}");
+  if (start !== -1 && end > start) {
     try {
-      return JSON.parse(jsonMatch[0]);
+      return JSON.parse(response.slice(start, end + 1));
     } catch {
       return { raw_response: response };
     }
@@ -64,6 +73,21 @@ function parseJsonResponse(response: string): Record<string, unknown> {
   return { raw_response: response };
 }
 
+/**
+ * Format file contents as fenced markdown sections separated by blank lines.
+ * Appends into one string instead of building and joining per-file copies.
+ */
+function formatFileContext(fileContents: Record<string, string>): string {
+  let context = "";
+  for (const [path, content] of Object.entries(fileContents)) {
+    if (context.length > 0) {
+      context += "\n\n";
+    }
+    context += `### ${path}\n\`\`\`\n${content}\n\`\`\``;
+  }
+  return context;
+}
+
 function readImageAsBase64(filePath: string): { data: string; mimeType: string } | null {
   if (!existsSync(filePath)) return null;
 
@@ -87,23 +111,19 @@ function readImageAsBase64(filePath: string): { data: string; mimeType: string }
   }
 }
 
-function getCommitSummaries(baseRef: string): string {
-  try {
-    const result = spawnSync("git", ["log", "--oneline", `${baseRef}..HEAD`], {
-      encoding: "utf-8",
-    });
-    return result.status === 0 ? result.stdout.trim() : "(No commits)";
-  } catch {
-    return "(Unable to get commits)";
-  }
+async function getCommitSummaries(baseRef: string): Promise<string> {
+  const result = await runGitAsync(["log", "--oneline", `${baseRef}..HEAD`]);
+  return result.ok ? result.stdout.trim() : "(No commits)";
 }
 
 function addProviderOption(cmd: Command): Command {
-  return cmd.option(
-    "--provider <provider>",
-    "LLM provider (gemini | openai)",
-    getDefaultProvider()
-  );
+  return cmd
+    .option(
+      "--provider <provider>",
+      "LLM provider (gemini | openai)",
+      getDefaultProvider()
+    )
+    .option("--cache", "Replay identical requests from the local response cache (off by default)");
 }
 
 // ============================================================================
@@ -112,10 +132,12 @@ function addProviderOption(cmd: Command): Command {
 
 abstract class OracleCommand extends BaseCommand {
   protected provider!: LLMProvider;
+  protected useCache = false;
 
   protected async initProvider(args: Record<string, unknown>): Promise<CommandResult | null> {
     const providerName = (args.provider as ProviderName) ?? getDefaultProvider();
     this.provider = await createProvider(providerName);
+    this.useCache = args.cache === true;
 
     const apiKey = this.provider.getApiKey();
     if (!apiKey) {
@@ -130,12 +152,31 @@ abstract class OracleCommand extends BaseCommand {
     usePro: boolean = false
   ): Promise<{ result: Awaited<ReturnType<typeof withRetry<{ text: string; model: string }>>>; durationMs: number }> {
     const start = performance.now();
+    const { config } = this.provider;
+    const cacheKey = responseCacheKey(
+      config.name,
+      usePro ? config.proModel : config.defaultModel,
+      contents
+    );
+
+    // Identical prompt already answered: replay it without a network call
+    if (this.useCache) {
+      const cached = readCachedResponse<GenerateResult>(cacheKey);
+      if (cached) {
+        const durationMs = Math.round(performance.now() - start);
+        return { result: { success: true, data: cached, retries: 0 }, durationMs };
+      }
+    }
+
     const result = await withRetry(
       () => this.provider.generate(contents, { usePro }),
-      `oracle.${this.provider.config.name}.${endpoint}`,
+      `oracle.${config.name}.${endpoint}`,
       {},
       ORACLE_FALLBACKS[endpoint]
     );
+    if (result.success && this.useCache) {
+      writeCachedResponse(cacheKey, result.data);
+    }
     const durationMs = Math.round(performance.now() - start);
     return { result, durationMs };
   }
@@ -220,11 +261,8 @@ class OracleAskCommand extends OracleCommand {
       parts.push(context);
     }
     if (files) {
-      const fileContents = this.readFiles(files);
-      if (Object.keys(fileContents).length > 0) {
-        const fileContext = Object.entries(fileContents)
-          .map(([path, content]) => `### ${path}\n\`\`\`\n${content}\n\`\`\``)
-          .join("\n\n");
+      const fileContext = formatFileContext(await this.readFiles(files));
+      if (fileContext) {
         parts.push(fileContext);
       }
     }
@@ -297,11 +335,12 @@ Output JSON:
     const authError = await this.initProvider(args);
     if (authError) return authError;
 
-    if (isDirectModeBranch(getBranch())) {
+    const branch = getBranch();
+    if (isDirectModeBranch(branch)) {
       return this.error("direct_mode", "No plan in direct mode");
     }
 
-    const planPath = getPlanDir();
+    const planPath = getPlanDir(undefined, branch);
     const planFile = `${planPath}/plan.md`;
     const queriesPath = (args.queries as string) ?? `${planPath}/queries.jsonl`;
     const context = args.context as string | undefined;
@@ -314,18 +353,20 @@ Output JSON:
     let queriesContent = "";
     const queriesFile = this.readFile(queriesPath);
     if (queriesFile) {
-      const queries = queriesFile
-        .split("\n")
-        .filter((line) => line.trim())
-        .map((line) => {
-          try {
-            return JSON.parse(line).prompt ?? "";
-          } catch {
-            return "";
+      // One pass over the lines: parse each record and emit its bullet directly
+      const bullets: string[] = [];
+      for (const line of queriesFile.split("\n")) {
+        if (!line.trim()) continue;
+        try {
+          const prompt = JSON.parse(line).prompt;
+          if (prompt) {
+            bullets.push(`- ${prompt}`);
           }
-        })
-        .filter(Boolean);
-      queriesContent = queries.map((q) => `- ${q}`).join("\n");
+        } catch {
+          // Skip malformed lines
+        }
+      }
+      queriesContent = bullets.join("\n");
     }
 
     const additional = context ? `\n\n## Additional Context\n${context}` : "";
@@ -398,13 +439,9 @@ Output JSON:
 
     let fileContext = "";
     if (files) {
-      const fileContents = this.readFiles(files);
-      if (Object.keys(fileContents).length > 0) {
-        fileContext =
-          "\n\n## Existing Code\n" +
-          Object.entries(fileContents)
-            .map(([path, content]) => `### ${path}\n\`\`\`\n${content}\n\`\`\``)
-            .join("\n\n");
+      const sections = formatFileContext(await this.readFiles(files));
+      if (sections) {
+        fileContext = "\n\n## Existing Code\n" + sections;
       }
     }
 
@@ -462,11 +499,12 @@ Output JSON:
     const authError = await this.initProvider(args);
     if (authError) return authError;
 
-    if (isDirectModeBranch(getBranch())) {
+    const branch = getBranch();
+    if (isDirectModeBranch(branch)) {
       return this.error("direct_mode", "No plan in direct mode");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -634,11 +672,12 @@ Output JSON:
     const authError = await this.initProvider(args);
     if (authError) return authError;
 
-    if (isDirectModeBranch(getBranch())) {
+    const branch = getBranch();
+    if (isDirectModeBranch(branch)) {
       return this.error("direct_mode", "No plan in direct mode");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -670,8 +709,11 @@ Output JSON:
     const userInput = readUserInput() ?? "";
     const promptId = getPromptId(promptNum, variant);
     const baseBranch = getBaseBranch();
-    const diffContent = getDiff(baseBranch);
-    const commits = getCommitSummaries(baseBranch);
+    // Diff and commit log are independent git calls; run them concurrently
+    const [diffContent, commits] = await Promise.all([
+      getDiff(baseBranch, MAX_REVIEW_DIFF_LENGTH),
+      getCommitSummaries(baseBranch),
+    ]);
 
     const fullPrompt = `${this.PROMPT_REVIEW_SYSTEM}
 
@@ -684,7 +726,7 @@ ${userInput}
 
 ## Implementation (git diff)
 \`\`\`diff
-${diffContent.substring(0, 50000)}
+${diffContent}
 \`\`\`
 
 ## Commit History
@@ -786,8 +828,11 @@ ${p.content}`;
       .join("\n\n");
 
     const baseBranch = getBaseBranch();
-    const diffContent = getDiff(baseBranch);
-    const commits = getCommitSummaries(baseBranch);
+    // Diff and commit log are independent git calls; run them concurrently
+    const [diffContent, commits] = await Promise.all([
+      getDiff(baseBranch, MAX_REVIEW_DIFF_LENGTH),
+      getCommitSummaries(baseBranch),
+    ]);
 
     const fullPrompt = `${this.FULL_REVIEW_SYSTEM}
 
@@ -804,7 +849,7 @@ ${curatorContent ? `## Curator Notes\n${curatorContent}` : ""}
 
 ## Implementation (git diff against ${baseBranch})
 \`\`\`diff
-${diffContent.substring(0, 50000)}
+${diffContent}
 \`\`\`
 
 ## Commit History
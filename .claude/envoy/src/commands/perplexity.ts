@@ -12,8 +12,22 @@ interface PerplexityResponse {
     };
   }>;
   citations?: string[];
+  error?: string;
 }
 
+interface PerplexityStreamChunk {
+  choices?: Array<{
+    delta?: {
+      content?: string;
+    };
+  }>;
+  citations?: string[];
+  error?: string | { message?: string };
+}
+
+// Reasoning blocks emitted by sonar-deep-research before the answer
+const THINK_BLOCK_PATTERN = /<think>[\s\S]*?<\/think>/g;
+
 class PerplexityResearchCommand extends BaseCommand {
   readonly name = "research";
   readonly description = "Deep research with citations, optional --grok-challenge to validate via X";
@@ -45,15 +59,21 @@ class PerplexityResearchCommand extends BaseCommand {
 
       let content = response.choices?.[0]?.message?.content ?? "";
       // Remove <think> tags if present
-      content = content.replace(/<think>[\s\S]*?<\/think>/g, "").trim();
+      content = content.replace(THINK_BLOCK_PATTERN, "").trim();
       const citations = response.citations ?? [];
 
+      if (response.error && !content) {
+        return this.error("api_error", response.error);
+      }
+
       const researchData = { content, citations };
       const meta: Record<string, unknown> = {
         model: "sonar-deep-research",
         command: "perplexity research",
         duration_ms: durationMs,
       };
+      // Stream ended with an error event after partial content: keep the answer, surface the error
+      if (response.error) meta.stream_error = response.error;
 
       if (!grokChallenge) {
         return this.success(researchData, meta);
@@ -107,6 +127,7 @@ class PerplexityResearchCommand extends BaseCommand {
         body: JSON.stringify({
           model: "sonar-deep-research",
           messages: [{ role: "user", content: query }],
+          stream: true,
         }),
         signal: controller.signal,
       });
@@ -115,11 +136,70 @@ class PerplexityResearchCommand extends BaseCommand {
         throw new Error(`HTTP ${response.status}: ${await response.text()}`);
       }
 
-      return (await response.json()) as PerplexityResponse;
+      return await this.readStream(response);
     } finally {
       clearTimeout(timeout);
     }
   }
+
+  /**
+   * Accumulate an SSE chat completion stream into a single response.
+   * Content deltas are joined as they arrive; citations come from the latest chunk carrying them.
+   * Unparseable data lines are skipped; error events are reported via `error`.
+   */
+  private async readStream(response: Response): Promise<PerplexityResponse> {
+    if (!response.body) {
+      return (await response.json()) as PerplexityResponse;
+    }
+
+    const decoder = new TextDecoder();
+    const parts: string[] = [];
+    let citations: string[] | undefined;
+    let error: string | undefined;
+    let buffered = "";
+
+    const handleLine = (line: string): void => {
+      if (!line.startsWith("data:")) return;
+      const payload = line.slice(5).trim();
+      if (!payload || payload === "[DONE]") return;
+      let chunk: PerplexityStreamChunk;
+      try {
+        chunk = JSON.parse(payload) as PerplexityStreamChunk;
+      } catch {
+        // Malformed or partial event: drop it rather than the whole answer
+        return;
+      }
+      if (chunk.error) {
+        error =
+          typeof chunk.error === "string"
+            ? chunk.error
+            : (chunk.error.message ?? JSON.stringify(chunk.error));
+      }
+      const delta = chunk.choices?.[0]?.delta?.content;
+      if (delta) parts.push(delta);
+      if (chunk.citations) citations = chunk.citations;
+    };
+
+    const reader = response.body.getReader();
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffered += decoder.decode(value, { stream: true });
+      let newline = buffered.indexOf("\n");
+      while (newline !== -1) {
+        handleLine(buffered.slice(0, newline).trimEnd());
+        buffered = buffered.slice(newline + 1);
+        newline = buffered.indexOf("\n");
+      }
+    }
+    handleLine((buffered + decoder.decode()).trimEnd());
+
+    return {
+      choices: [{ message: { content: parts.join("") } }],
+      citations,
+      error,
+    };
+  }
 }
 
 // Auto-discovered by cli.ts
@@ -3,7 +3,8 @@
  */
 
 import { Command } from "commander";
-import { readdirSync, rmSync, statSync } from "fs";
+import { readdirSync, type Dirent } from "fs";
+import { rm } from "fs/promises";
 import { join } from "path";
 import { spawnSync } from "child_process";
 import {
@@ -12,6 +13,7 @@ import {
   getBranch,
   getProjectRoot,
   getPromptId,
+  listLocalBranches,
   planExists,
   readAllPrompts,
   readPlan,
@@ -65,7 +67,7 @@ export class StatusCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    const exists = planExists();
+    const exists = planExists(branch);
 
     return this.success({
       exists,
@@ -92,7 +94,7 @@ export class CheckCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.success({
         exists: false,
         stage: null,
@@ -101,9 +103,6 @@ export class CheckCommand extends BaseCommand {
     }
 
     const plan = readPlan();
-    const userInput = readUserInput();
-    const summary = readSummary();
-    const prompts = readAllPrompts();
 
     // Default stage if plan doesn't exist yet
     const stage = plan?.frontMatter?.stage ?? "draft";
@@ -115,14 +114,18 @@ export class CheckCommand extends BaseCommand {
       branch,
     };
 
-    if (stage === "draft" && userInput) {
+    // Only read the files the current stage reports
+    if (stage === "draft") {
       // Draft with user input: return user_input.md
-      response.user_input = userInput;
+      const userInput = readUserInput();
+      if (userInput) {
+        response.user_input = userInput;
+      }
     } else if (stage === "in_progress") {
       // In progress: return user_input, plan context, and prompt descriptions
-      response.user_input = userInput;
+      response.user_input = readUserInput();
       response.plan_context = plan?.content ?? null;
-      response.prompts = prompts.map((p) => ({
+      response.prompts = readAllPrompts().map((p) => ({
         id: getPromptId(p.number, p.variant),
         description: p.frontMatter.description,
         status: p.frontMatter.status,
@@ -131,7 +134,7 @@ export class CheckCommand extends BaseCommand {
       }));
     } else if (stage === "completed") {
       // Completed: return summary
-      response.summary = summary;
+      response.summary = readSummary();
     }
 
     return this.success(response);
@@ -153,57 +156,50 @@ export class CleanupOrphanedCommand extends BaseCommand {
     const root = getProjectRoot();
     const plansDir = join(root, ".claude", "plans");
 
-    // Exit if plans directory doesn't exist
+    // Single directory scan; dirents carry the type so no per-entry stat is needed
+    let entries: Dirent[];
     try {
-      statSync(plansDir);
-    } catch {
-      return this.success({ cleaned: [], message: "No plans directory" });
+      entries = readdirSync(plansDir, { withFileTypes: true });
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code === "ENOENT") {
+        return this.success({ cleaned: [], message: "No plans directory" });
+      }
+      return this.success({ cleaned: [], message: "Plans directory empty or inaccessible" });
     }
 
-    // Get all local branches (sanitized)
-    const branchResult = spawnSync("git", ["branch", "--format=%(refname:short)"], {
-      encoding: "utf-8",
-      cwd: root,
-    });
-    if (branchResult.status !== 0) {
-      return this.error("git_error", "Failed to list branches");
+    // Get all local branches (sanitized), reading refs directly when possible
+    let branchNames = listLocalBranches(root);
+    if (branchNames === null) {
+      const branchResult = spawnSync("git", ["branch", "--format=%(refname:short)"], {
+        encoding: "utf-8",
+        cwd: root,
+      });
+      if (branchResult.status !== 0) {
+        return this.error("git_error", "Failed to list branches");
+      }
+      branchNames = branchResult.stdout.trim().split("\n").filter(Boolean);
     }
 
-    const localBranches = new Set(
-      branchResult.stdout
-        .trim()
-        .split("\n")
-        .filter(Boolean)
-        .map(sanitizeBranch)
-    );
+    const localBranches = new Set(branchNames.map(sanitizeBranch));
 
     // Find orphaned plan directories
-    const cleaned: string[] = [];
-    let entries: string[];
-    try {
-      entries = readdirSync(plansDir);
-    } catch {
-      return this.success({ cleaned: [], message: "Plans directory empty or inaccessible" });
-    }
+    const orphans = entries
+      .filter((dirent) => dirent.isDirectory() && !localBranches.has(dirent.name))
+      .map((dirent) => dirent.name);
 
-    for (const entry of entries) {
-      const entryPath = join(plansDir, entry);
-      try {
-        if (!statSync(entryPath).isDirectory()) continue;
-      } catch {
-        continue;
-      }
+    // Remove them concurrently; each removal succeeds or fails on its own
+    const results = await Promise.allSettled(
+      orphans.map((entry) => rm(join(plansDir, entry), { recursive: true, force: true }))
+    );
 
-      // Remove if no matching branch
-      if (!localBranches.has(entry)) {
-        try {
-          rmSync(entryPath, { recursive: true, force: true });
-          cleaned.push(entry);
-        } catch (error) {
-          console.warn(`Failed to remove orphaned plan directory '${entryPath}':`, error);
-        }
+    const cleaned: string[] = [];
+    results.forEach((result, i) => {
+      if (result.status === "fulfilled") {
+        cleaned.push(orphans[i]);
+      } else {
+        console.warn(`Failed to remove orphaned plan directory '${join(plansDir, orphans[i])}':`, result.reason);
       }
-    }
+    });
 
     return this.success({
       cleaned,
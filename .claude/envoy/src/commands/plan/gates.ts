@@ -54,6 +54,11 @@ export function getBlockingGateTimeout(): number {
   return DEFAULT_BLOCKING_GATE_TIMEOUT_MS;
 }
 
+/** Help for gates that return pasted logs; truncation is opt-in */
+const GATE_LOG_HELP = `
+The pasted log file is returned in full. Set ENVOY_GATE_LOG_MAX_LINES=<n> to return only
+its last n lines, prefixed with a marker giving how many earlier bytes were omitted.`;
+
 /**
  * Block for findings gate - user reviews specialist approaches before planning.
  */
@@ -71,7 +76,7 @@ export class BlockFindingsGateCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -268,7 +273,7 @@ export class BlockPlanGateCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -354,6 +359,7 @@ export class BlockPromptTestingGateCommand extends BaseCommand {
   defineArguments(cmd: Command): void {
     cmd.argument("<prompt_num>", "Prompt number (integer)");
     cmd.argument("[variant]", "Optional variant letter (A, B, etc.)");
+    cmd.addHelpText("after", GATE_LOG_HELP);
   }
 
   async execute(args: Record<string, unknown>): Promise<CommandResult> {
@@ -571,6 +577,7 @@ export class BlockDebuggingLoggingGateCommand extends BaseCommand {
   defineArguments(cmd: Command): void {
     cmd.argument("<prompt_num>", "Prompt number (integer)");
     cmd.argument("[variant]", "Optional variant letter (A, B, etc.)");
+    cmd.addHelpText("after", GATE_LOG_HELP);
   }
 
   async execute(args: Record<string, unknown>): Promise<CommandResult> {
@@ -2,9 +2,8 @@
  * Prompt lifecycle commands: next, start-prompt, record-implementation, complete-prompt, etc.
  */
 
-import { execSync, spawnSync } from "child_process";
+import { spawnSync } from "child_process";
 import { Command } from "commander";
-import { GoogleGenAI } from "@google/genai";
 import type { PromptFrontMatter } from "../../lib/index.js";
 import {
   getBaseBranch,
@@ -39,7 +38,7 @@ export class NextCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -470,7 +469,7 @@ export class GetAllWalkthroughsCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -510,7 +509,7 @@ export class MarkAllDocumentedCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -554,7 +553,7 @@ export class ReleaseAllPromptsCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -613,7 +612,7 @@ Format:
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
@@ -627,7 +626,7 @@ Format:
     const userInput = readUserInput();
     const prompts = readAllPrompts();
     const baseBranch = getBaseBranch();
-    const diff = getDiff(baseBranch);
+    const diff = await getDiff(baseBranch, 50000);
 
     // Build context for summary generation
     const promptSummaries = prompts.map((p) => {
@@ -652,7 +651,7 @@ ${promptSummaries}
 
 ## Git Diff (against ${baseBranch})
 \`\`\`diff
-${diff.substring(0, 50000)}
+${diff}
 \`\`\`
 
 Generate the PR summary now.`;
@@ -660,7 +659,8 @@ Generate the PR summary now.`;
     try {
       // Generate summary with Gemini
       const [summary, durationMs] = await this.timedExecute(async () => {
-        const client = new GoogleGenAI({ vertexai: true, apiKey });
+        const { getVertexClient } = await import("../../lib/gemini-provider.js");
+        const client = getVertexClient(apiKey);
         const result = await client.models.generateContent({
           model: "gemini-2.0-flash",
           contents: fullPrompt,
@@ -674,12 +674,8 @@ Generate the PR summary now.`;
       // Update plan stage to completed
       updatePlanStage("completed");
 
-      // Push to remote
-      try {
-        execSync(`git push -u origin ${branch}`, { encoding: "utf-8", stdio: "pipe" });
-      } catch {
-        // Push might fail if already up to date or no remote
-      }
+      // Push to remote (might fail if already up to date or no remote)
+      spawnSync("git", ["push", "-u", "origin", branch], { stdio: "pipe" });
 
       // Create PR using gh CLI
       let prUrl = "";
@@ -79,7 +79,7 @@ export class GetFullPlanCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
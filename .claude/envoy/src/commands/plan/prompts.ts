@@ -182,7 +182,7 @@ export class ValidateDependenciesCommand extends BaseCommand {
       return this.error("no_branch", "Not in a git repository or no branch checked out");
     }
 
-    if (!planExists()) {
+    if (!planExists(branch)) {
       return this.error("no_plan", "No plan directory exists for this branch");
     }
 
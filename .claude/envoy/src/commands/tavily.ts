@@ -4,6 +4,7 @@
 
 import { Command } from "commander";
 import { BaseCommand, type CommandResult } from "./base.js";
+import { withRetry, type RetryOptions } from "../lib/retry.js";
 
 interface TavilySearchResult {
   title?: string;
@@ -32,6 +33,103 @@ interface TavilyExtractResponse {
   response_time?: number;
 }
 
+const TAVILY_API_BASE = "https://api.tavily.com";
+
+/** URLs per extract request; larger batches are split and sent concurrently */
+const EXTRACT_CHUNK_SIZE = 5;
+
+/** Short backoff for transient 429/5xx/network failures */
+const TAVILY_RETRY_OPTIONS: RetryOptions = {
+  maxRetries: 2,
+  initialDelayMs: 200,
+};
+
+/**
+ * POST a JSON payload to a Tavily endpoint (single attempt).
+ */
+async function postTavily<T>(
+  endpoint: "search" | "extract",
+  apiKey: string,
+  payload: Record<string, unknown>,
+  timeoutMs: number
+): Promise<T> {
+  const controller = new AbortController();
+  const timeout = setTimeout(() => controller.abort(), timeoutMs);
+
+  try {
+    const response = await fetch(`${TAVILY_API_BASE}/${endpoint}`, {
+      method: "POST",
+      headers: {
+        Authorization: `Bearer ${apiKey}`,
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify(payload),
+      signal: controller.signal,
+    });
+
+    if (!response.ok) {
+      throw new Error(`HTTP ${response.status}: ${await response.text()}`);
+    }
+
+    return (await response.json()) as T;
+  } finally {
+    clearTimeout(timeout);
+  }
+}
+
+/**
+ * POST to a Tavily endpoint, retrying transient failures with backoff.
+ * Shared by all Tavily commands so requests go through one client path
+ * (fetch's global dispatcher keeps the connection alive between calls).
+ */
+async function callTavily<T>(
+  endpoint: "search" | "extract",
+  apiKey: string,
+  payload: Record<string, unknown>,
+  timeoutMs: number
+): Promise<T> {
+  const result = await withRetry(
+    () => postTavily<T>(endpoint, apiKey, payload, timeoutMs),
+    `tavily.${endpoint}`,
+    TAVILY_RETRY_OPTIONS
+  );
+  if (!result.success) {
+    throw new Error(result.error);
+  }
+  return result.data;
+}
+
+/**
+ * Combine chunked extract responses; response_time is the slowest chunk's.
+ * URLs of a chunk whose request failed are reported in failed_results so the
+ * other chunks' content is kept. If every chunk failed, the first error is thrown.
+ */
+function mergeExtractResponses(
+  settled: PromiseSettledResult<TavilyExtractResponse>[],
+  chunks: string[][]
+): TavilyExtractResponse {
+  if (settled.every((outcome) => outcome.status === "rejected")) {
+    throw (settled[0] as PromiseRejectedResult).reason;
+  }
+  const results: TavilyExtractResult[] = [];
+  const failed: unknown[] = [];
+  let responseTime: number | undefined;
+  settled.forEach((outcome, i) => {
+    if (outcome.status === "rejected") {
+      const error = outcome.reason instanceof Error ? outcome.reason.message : String(outcome.reason);
+      failed.push(...chunks[i].map((url) => ({ url, error })));
+      return;
+    }
+    const response = outcome.value;
+    results.push(...(response.results ?? []));
+    failed.push(...(response.failed_results ?? []));
+    if (response.response_time !== undefined) {
+      responseTime = Math.max(responseTime ?? 0, response.response_time);
+    }
+  });
+  return { results, failed_results: failed, response_time: responseTime };
+}
+
 class TavilySearchCommand extends BaseCommand {
   readonly name = "search";
   readonly description = "Web search with optional LLM answer";
@@ -64,7 +162,7 @@ class TavilySearchCommand extends BaseCommand {
 
     try {
       const [response, durationMs] = await this.timedExecute(() =>
-        this.callApi(apiKey, payload)
+        callTavily<TavilySearchResponse>("search", apiKey, payload, this.timeoutMs)
       );
 
       const results = (response.results ?? []).map((r) => ({
@@ -95,34 +193,6 @@ class TavilySearchCommand extends BaseCommand {
       return this.error("api_error", e instanceof Error ? e.message : String(e));
     }
   }
-
-  private async callApi(
-    apiKey: string,
-    payload: Record<string, unknown>
-  ): Promise<TavilySearchResponse> {
-    const controller = new AbortController();
-    const timeout = setTimeout(() => controller.abort(), this.timeoutMs);
-
-    try {
-      const response = await fetch("https://api.tavily.com/search", {
-        method: "POST",
-        headers: {
-          Authorization: `Bearer ${apiKey}`,
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify(payload),
-        signal: controller.signal,
-      });
-
-      if (!response.ok) {
-        throw new Error(`HTTP ${response.status}: ${await response.text()}`);
-      }
-
-      return (await response.json()) as TavilySearchResponse;
-    } finally {
-      clearTimeout(timeout);
-    }
-  }
 }
 
 class TavilyExtractCommand extends BaseCommand {
@@ -145,17 +215,32 @@ class TavilyExtractCommand extends BaseCommand {
       return this.error("invalid_input", "Maximum 20 URLs allowed");
     }
 
-    const payload = {
-      urls,
-      extract_depth: "advanced",
-      format: "markdown",
-      include_images: false,
-    };
+    // Advanced extraction cost grows per URL, so split into chunks fetched in parallel
+    const chunks: string[][] = [];
+    for (let i = 0; i < urls.length; i += EXTRACT_CHUNK_SIZE) {
+      chunks.push(urls.slice(i, i + EXTRACT_CHUNK_SIZE));
+    }
 
     try {
-      const [response, durationMs] = await this.timedExecute(() =>
-        this.callApi(apiKey, payload)
-      );
+      const [response, durationMs] = await this.timedExecute(async () => {
+        // allSettled: one failed chunk must not discard the others' content
+        const settled = await Promise.allSettled(
+          chunks.map((chunk) =>
+            callTavily<TavilyExtractResponse>(
+              "extract",
+              apiKey,
+              {
+                urls: chunk,
+                extract_depth: "advanced",
+                format: "markdown",
+                include_images: false,
+              },
+              this.timeoutMs
+            )
+          )
+        );
+        return mergeExtractResponses(settled, chunks);
+      });
 
       const results = (response.results ?? []).map((r) => ({
         url: r.url,
@@ -182,34 +267,6 @@ class TavilyExtractCommand extends BaseCommand {
       return this.error("api_error", e instanceof Error ? e.message : String(e));
     }
   }
-
-  private async callApi(
-    apiKey: string,
-    payload: Record<string, unknown>
-  ): Promise<TavilyExtractResponse> {
-    const controller = new AbortController();
-    const timeout = setTimeout(() => controller.abort(), this.timeoutMs);
-
-    try {
-      const response = await fetch("https://api.tavily.com/extract", {
-        method: "POST",
-        headers: {
-          Authorization: `Bearer ${apiKey}`,
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify(payload),
-        signal: controller.signal,
-      });
-
-      if (!response.ok) {
-        throw new Error(`HTTP ${response.status}: ${await response.text()}`);
-      }
-
-      return (await response.json()) as TavilyExtractResponse;
-    } finally {
-      clearTimeout(timeout);
-    }
-  }
 }
 
 // Auto-discovered by cli.ts
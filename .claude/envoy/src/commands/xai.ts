@@ -3,6 +3,7 @@
  */
 
 import { Command } from "commander";
+import { readCachedResponse, responseCacheKey, writeCachedResponse } from "../lib/response-cache.js";
 import { BaseCommand, type CommandResult } from "./base.js";
 
 const SYSTEM_PROMPT = `You are a technology research assistant. Search X (Twitter) for posts about the given technology, tool, or concept.
@@ -26,6 +27,16 @@ const CHALLENGER_PROMPT = `You are a critical research challenger. Given researc
 
 Be skeptical. Surface what the research missed or got wrong. Focus on recent posts (last 6 months).`;
 
+const XAI_API_URL = "https://api.x.ai/v1/chat/completions";
+const XAI_MODEL = "grok-4-1-fast";
+
+/** Searches target recent posts, so cached results go stale quickly (6h) */
+const XAI_CACHE_TTL_MS = 6 * 60 * 60 * 1000;
+
+/** Static system messages, serialized once; only the user message is encoded per request */
+const SEARCH_SYSTEM_MESSAGE = JSON.stringify({ role: "system", content: SYSTEM_PROMPT });
+const CHALLENGER_SYSTEM_MESSAGE = JSON.stringify({ role: "system", content: CHALLENGER_PROMPT });
+
 interface XaiResponse {
   choices?: Array<{
     message?: {
@@ -54,7 +65,8 @@ class XaiSearchCommand extends BaseCommand {
       .option(
         "--results-to-challenge <results>",
         "Research results to challenge (enables challenger mode)"
-      );
+      )
+      .option("--cache", "Replay identical requests from the local response cache (off by default)");
   }
 
   async execute(args: Record<string, unknown>): Promise<CommandResult> {
@@ -68,11 +80,11 @@ class XaiSearchCommand extends BaseCommand {
     const resultsToChallenge = args.resultsToChallenge as string | undefined;
 
     // Determine mode and build prompt
-    let systemPrompt: string;
+    let systemMessage: string;
     let userPrompt: string;
 
     if (resultsToChallenge) {
-      systemPrompt = CHALLENGER_PROMPT;
+      systemMessage = CHALLENGER_SYSTEM_MESSAGE;
       userPrompt = `Original query: ${query}
 
 Research findings to challenge:
@@ -80,7 +92,7 @@ ${resultsToChallenge}
 
 Search X to challenge these findings.`;
     } else if (context) {
-      systemPrompt = SYSTEM_PROMPT;
+      systemMessage = SEARCH_SYSTEM_MESSAGE;
       userPrompt = `Previous research findings:
 ${context}
 
@@ -88,14 +100,21 @@ Now search X for additional insights about: ${query}
 
 Focus on opinions, alternatives, and community discussions that complement the existing findings.`;
     } else {
-      systemPrompt = SYSTEM_PROMPT;
+      systemMessage = SEARCH_SYSTEM_MESSAGE;
       userPrompt = `Search X for developer opinions, experiences, and alternatives regarding: ${query}`;
     }
 
+    const useCache = args.cache === true;
+    const cacheKey = responseCacheKey("xai", XAI_MODEL, systemMessage, userPrompt);
+
     try {
-      const [response, durationMs] = await this.timedExecute(() =>
-        this.callApi(apiKey, userPrompt, systemPrompt)
-      );
+      const [response, durationMs] = await this.timedExecute(async () => {
+        const cached = useCache ? readCachedResponse<XaiResponse>(cacheKey, XAI_CACHE_TTL_MS) : null;
+        if (cached) return cached;
+        const fresh = await this.callApi(apiKey, userPrompt, systemMessage);
+        if (useCache) writeCachedResponse(cacheKey, fresh);
+        return fresh;
+      });
 
       const content = response.choices?.[0]?.message?.content ?? "";
       const citations = response.citations ?? [];
@@ -108,7 +127,7 @@ Focus on opinions, alternatives, and community discussions that complement the e
           citations,
         },
         {
-          model: "grok-4-1-fast",
+          model: XAI_MODEL,
           command: "xai search",
           duration_ms: durationMs,
           input_tokens: usage.prompt_tokens,
@@ -128,25 +147,20 @@ Focus on opinions, alternatives, and community discussions that complement the e
   private async callApi(
     apiKey: string,
     userPrompt: string,
-    systemPrompt: string
+    systemMessage: string
   ): Promise<XaiResponse> {
     const controller = new AbortController();
     const timeout = setTimeout(() => controller.abort(), this.timeoutMs);
 
     try {
-      const response = await fetch("https://api.x.ai/v1/chat/completions", {
+      const userMessage = JSON.stringify({ role: "user", content: userPrompt });
+      const response = await fetch(XAI_API_URL, {
         method: "POST",
         headers: {
           Authorization: `Bearer ${apiKey}`,
           "Content-Type": "application/json",
         },
-        body: JSON.stringify({
-          model: "grok-4-1-fast",
-          messages: [
-            { role: "system", content: systemPrompt },
-            { role: "user", content: userPrompt },
-          ],
-        }),
+        body: `{"model":${JSON.stringify(XAI_MODEL)},"messages":[${systemMessage},${userMessage}]}`,
         signal: controller.signal,
       });
 
@@ -3,14 +3,16 @@
  * Each run spawns a fresh server instance, executes the agent, and cleans up.
  */
 
-import { createOpencode } from "@opencode-ai/sdk";
-import { existsSync, readFileSync, statSync } from "fs";
+import { closeSync, fstatSync, openSync, readFileSync, readSync } from "fs";
 import { join } from "path";
 import { logCommandComplete, logCommandStart } from "../observability.js";
 import type { AgentConfig, AgentResult } from "./index.js";
 
 const MAX_EXPANSIONS = 3;
 const EXPANSION_PATTERN = /^EXPAND:\s*(.+)$/gm;
+// Non-global twin for presence checks (no lastIndex state to reset)
+const EXPANSION_TEST_PATTERN = /^EXPAND:\s*(.+)$/m;
+const JSON_CODE_BLOCK_PATTERN = /```(?:json)?\s*([\s\S]*?)```/;
 const DEFAULT_TIMEOUT_MS = 60000;
 
 export class AgentRunner {
@@ -25,12 +27,14 @@ export class AgentRunner {
    * Spawns server, creates session, sends message, handles expansions, cleans up.
    */
   async run<T>(config: AgentConfig, userMessage: string): Promise<AgentResult<T>> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     logCommandStart("agent.run", { agent: config.name });
 
     let server: { close: () => void } | null = null;
 
     try {
+      // Loaded on demand so commands that never run agents skip the SDK import
+      const { createOpencode } = await import("@opencode-ai/sdk");
       const { client, server: srv } = await createOpencode({
         port: 0, // Let OS pick available port to avoid conflicts in parallel runs
         timeout: config.timeoutMs ?? DEFAULT_TIMEOUT_MS,
@@ -83,7 +87,7 @@ export class AgentRunner {
         expansionCount++;
       }
 
-      const durationMs = Date.now() - startTime;
+      const durationMs = Math.round(performance.now() - startTime);
       const parsed = this.parseStructuredOutput<T>(responseText);
 
       if (!parsed) {
@@ -102,7 +106,7 @@ export class AgentRunner {
           throw new Error("Failed to parse agent response as JSON");
         }
 
-        logCommandComplete("agent.run", "success", Date.now() - startTime, {
+        logCommandComplete("agent.run", "success", Math.round(performance.now() - startTime), {
           agent: config.name,
           expansions: expansionCount,
           retry: true,
@@ -113,7 +117,7 @@ export class AgentRunner {
           data: retryParsed,
           metadata: {
             model: config.model ?? "default",
-            duration_ms: Date.now() - startTime,
+            duration_ms: Math.round(performance.now() - startTime),
           },
         };
       }
@@ -132,7 +136,7 @@ export class AgentRunner {
         },
       };
     } catch (error) {
-      const durationMs = Date.now() - startTime;
+      const durationMs = Math.round(performance.now() - startTime);
       const errorMessage = error instanceof Error ? error.message : String(error);
 
       logCommandComplete("agent.run", "error", durationMs, {
@@ -174,20 +178,18 @@ export class AgentRunner {
   }
 
   private hasExpansionRequest(text: string): boolean {
-    const regex = new RegExp(EXPANSION_PATTERN.source, EXPANSION_PATTERN.flags);
-    return regex.test(text);
+    return EXPANSION_TEST_PATTERN.test(text);
   }
 
   private extractExpansionPaths(text: string): string[] {
-    const paths: string[] = [];
-    const regex = new RegExp(EXPANSION_PATTERN.source, "gm");
-    let match;
-
-    while ((match = regex.exec(text)) !== null) {
-      paths.push(match[1].trim());
+    // Set keeps first-seen order and drops repeats so each file is read once
+    const paths = new Set<string>();
+    // matchAll iterates a clone, so the shared global pattern needs no reset
+    for (const match of text.matchAll(EXPANSION_PATTERN)) {
+      paths.add(match[1].trim());
     }
 
-    return paths;
+    return [...paths];
   }
 
   private readFiles(paths: string[]): Map<string, string | null> {
@@ -196,19 +198,22 @@ export class AgentRunner {
 
     for (const path of paths) {
       const fullPath = join(this.projectRoot, path);
-      if (existsSync(fullPath)) {
+      // One open per file: fstat on the descriptor replaces separate exists/stat probes
+      try {
+        const fd = openSync(fullPath, "r");
         try {
-          const stats = statSync(fullPath);
-          if (stats.size > MAX_FILE_SIZE) {
-            const partial = readFileSync(fullPath, "utf-8").slice(0, MAX_FILE_SIZE);
+          if (fstatSync(fd).size > MAX_FILE_SIZE) {
+            const buf = Buffer.alloc(MAX_FILE_SIZE);
+            const bytesRead = readSync(fd, buf, 0, MAX_FILE_SIZE, 0);
+            const partial = buf.toString("utf-8", 0, bytesRead);
             contents.set(path, `${partial}\n\n[TRUNCATED: file exceeds 1MB limit]`);
           } else {
-            contents.set(path, readFileSync(fullPath, "utf-8"));
+            contents.set(path, readFileSync(fd, "utf-8"));
           }
-        } catch {
-          contents.set(path, null);
+        } finally {
+          closeSync(fd);
         }
-      } else {
+      } catch {
         contents.set(path, null);
       }
     }
@@ -233,7 +238,7 @@ export class AgentRunner {
 
   private parseStructuredOutput<T>(text: string): T | null {
     // Try to extract JSON from code block
-    const codeBlockMatch = text.match(/```(?:json)?\s*([\s\S]*?)```/);
+    const codeBlockMatch = text.match(JSON_CODE_BLOCK_PATTERN);
     if (codeBlockMatch) {
       try {
         return JSON.parse(codeBlockMatch[1].trim()) as T;
@@ -2,7 +2,7 @@
  * User feedback gate operations (blocking gates).
  */
 
-import { existsSync, mkdirSync, readFileSync, writeFileSync, unlinkSync } from "fs";
+import { closeSync, existsSync, fstatSync, mkdirSync, openSync, readFileSync, readSync, writeFileSync, unlinkSync } from "fs";
 import { parse as parseYaml, stringify as stringifyYaml } from "yaml";
 import { ensurePlanDir, getPlanPaths, getUserFeedbackPath, getPromptId } from "./paths.js";
 import { readMarkdownFile, writeMarkdownWithFrontMatter, stripLogPlaceholder } from "./markdown.js";
@@ -39,6 +39,56 @@ export type {
   ReviewQuestionsFeedback,
 };
 
+/**
+ * Max trailing lines of pasted gate logs to return. Opt-in via env; unset or 0
+ * returns the whole log, as reviewers have always seen it.
+ */
+const MAX_GATE_LOG_LINES = parseInt(
+  process.env.ENVOY_GATE_LOG_MAX_LINES ?? "0",
+  10
+);
+
+/**
+ * Read the last maxLines lines of a log file without loading all of it.
+ * Reads a window from the end and doubles it until enough newlines are found.
+ * Truncated output starts with a marker line saying how much was left out.
+ */
+function readLogTail(filePath: string, maxLines = MAX_GATE_LOG_LINES): string {
+  if (!(maxLines > 0)) {
+    return readFileSync(filePath, "utf-8");
+  }
+
+  const fd = openSync(filePath, "r");
+  try {
+    const size = fstatSync(fd).size;
+    let window = Math.min(size, Math.max(maxLines * 256, 64 * 1024));
+    for (;;) {
+      const start = size - window;
+      const buf = Buffer.alloc(window);
+      readSync(fd, buf, 0, window, start);
+
+      // A trailing newline terminates the last line rather than starting a new one
+      let pos = buf.length > 0 && buf[buf.length - 1] === 0x0a ? buf.length - 1 : buf.length;
+      for (let found = 0; found < maxLines; found++) {
+        pos = pos > 0 ? buf.lastIndexOf(0x0a, pos - 1) : -1;
+        if (pos === -1) break;
+      }
+
+      if (pos !== -1) {
+        const omittedBytes = start + pos + 1;
+        const marker = `[… ${omittedBytes} earlier bytes omitted; showing the last ${maxLines} lines]`;
+        return `${marker}\n${buf.subarray(pos + 1).toString("utf-8")}`;
+      }
+      if (start === 0) {
+        return buf.toString("utf-8");
+      }
+      window = Math.min(size, window * 2);
+    }
+  } finally {
+    closeSync(fd);
+  }
+}
+
 /**
  * Write a findings gate feedback file.
  */
@@ -198,7 +248,7 @@ export function readTestingGateFeedback(
     // Read sibling log file, stripping placeholder if no real content
     let logs = "";
     if (existsSync(logsPath)) {
-      logs = stripLogPlaceholder(readFileSync(logsPath, "utf-8"));
+      logs = stripLogPlaceholder(readLogTail(logsPath));
     }
 
     return { success: true, data: { ...result.data, logs } };
@@ -355,7 +405,7 @@ export function readLoggingGateFeedback(
     // Read sibling log file, stripping placeholder if no real content
     let logs = "";
     if (existsSync(logsPath)) {
-      logs = stripLogPlaceholder(readFileSync(logsPath, "utf-8"));
+      logs = stripLogPlaceholder(readLogTail(logsPath));
     }
 
     return { success: true, data: { ...result.data, logs } };
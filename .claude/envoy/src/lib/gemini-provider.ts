@@ -12,6 +12,21 @@ import type {
 } from "./providers.js";
 import { PROVIDER_CONFIGS } from "./providers.js";
 
+/** Vertex clients keyed by API key, reused so chained calls share auth and transport state */
+const vertexClients = new Map<string, GoogleGenAI>();
+
+/**
+ * Get the shared Vertex AI client for an API key, creating it on first use.
+ */
+export function getVertexClient(apiKey: string): GoogleGenAI {
+  let client = vertexClients.get(apiKey);
+  if (!client) {
+    client = new GoogleGenAI({ vertexai: true, apiKey });
+    vertexClients.set(apiKey, client);
+  }
+  return client;
+}
+
 export class GeminiProvider implements LLMProvider {
   readonly config: ProviderConfig = PROVIDER_CONFIGS.gemini;
 
@@ -30,9 +45,16 @@ export class GeminiProvider implements LLMProvider {
 
     const model =
       options?.model ?? (options?.usePro ? this.config.proModel : this.config.defaultModel);
-    const client = new GoogleGenAI({ vertexai: true, apiKey });
+    const client = getVertexClient(apiKey);
 
-    const result = await client.models.generateContent({ model, contents });
-    return { text: result.text ?? "", model };
+    // Stream the response so long review/architect output arrives as it is generated
+    const stream = await client.models.generateContentStream({ model, contents });
+    const chunks: string[] = [];
+    for await (const chunk of stream) {
+      if (chunk.text) {
+        chunks.push(chunk.text);
+      }
+    }
+    return { text: chunks.join(""), model };
   }
 }
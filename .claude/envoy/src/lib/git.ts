@@ -2,8 +2,10 @@
  * Git utilities for claude-envoy.
  */
 
-import { execSync, spawnSync } from "child_process";
-import { basename } from "path";
+import { execFile, execFileSync, spawn, spawnSync } from "child_process";
+import { existsSync, readdirSync, readFileSync, statSync } from "fs";
+import { basename, dirname, join, resolve } from "path";
+import { StringDecoder } from "string_decoder";
 
 // Protected branches - no planning required
 const PROTECTED_BRANCHES = new Set([
@@ -18,31 +20,55 @@ const PROTECTED_BRANCHES = new Set([
   "prod",
 ]);
 
-// Prefixes that indicate direct mode (no planning)
-const DIRECT_MODE_PREFIXES = ["quick/", "curator/"];
+// Prefixes that indicate direct mode (no planning): quick/, curator/
+const DIRECT_MODE_PREFIX_PATTERN = /^(?:quick|curator)\//;
+
+// Characters not allowed in plan directory names
+const UNSAFE_BRANCH_CHARS = /[^a-zA-Z0-9_-]/g;
+
+// Current branch per starting directory, cleared when a command switches branches
+const branchCache = new Map<string, string>();
 
 /**
  * Get current git branch name.
  * Uses CLAUDE_PROJECT_DIR if available (for hooks), else current directory.
+ * Cached per starting directory; call clearBranchCache() after a checkout.
  */
 export function getBranch(): string {
-  try {
-    const cwd = process.env.CLAUDE_PROJECT_DIR || process.cwd();
-    const result = spawnSync("git", ["branch", "--show-current"], {
-      encoding: "utf-8",
-      cwd,
-    });
-    return result.status === 0 ? result.stdout.trim() : "";
-  } catch {
-    return "";
+  const cwd = process.env.CLAUDE_PROJECT_DIR || process.cwd();
+  const cached = branchCache.get(cwd);
+  if (cached !== undefined) {
+    return cached;
   }
+
+  let branch = readHeadBranch(cwd);
+  if (branch === null) {
+    try {
+      const result = spawnSync("git", ["branch", "--show-current"], {
+        encoding: "utf-8",
+        cwd,
+      });
+      branch = result.status === 0 ? result.stdout.trim() : "";
+    } catch {
+      branch = "";
+    }
+  }
+  branchCache.set(cwd, branch);
+  return branch;
+}
+
+/**
+ * Clear cached branch lookups (after checkout, or for tests).
+ */
+export function clearBranchCache(): void {
+  branchCache.clear();
 }
 
 /**
  * Convert branch name to safe directory name (feat/auth -> feat-auth).
  */
 export function sanitizeBranch(branch: string): string {
-  return branch.replace(/[^a-zA-Z0-9_-]/g, "-");
+  return branch.replace(UNSAFE_BRANCH_CHARS, "-");
 }
 
 /**
@@ -52,7 +78,7 @@ export function isDirectModeBranch(branch: string): boolean {
   if (PROTECTED_BRANCHES.has(branch)) {
     return true;
   }
-  return DIRECT_MODE_PREFIXES.some((prefix) => branch.startsWith(prefix));
+  return DIRECT_MODE_PREFIX_PATTERN.test(branch);
 }
 
 /**
@@ -68,7 +94,11 @@ export function getBaseBranch(): string {
 
   const candidates = ["main", "master", "develop", "staging", "production"];
 
-  for (const base of candidates) {
+  // Only spawn merge-base for candidates that exist locally
+  const local = listLocalBranches();
+  const existing = local === null ? candidates : candidates.filter((base) => local.includes(base));
+
+  for (const base of existing) {
     try {
       const result = spawnSync("git", ["merge-base", base, "HEAD"], {
         encoding: "utf-8",
@@ -84,47 +114,216 @@ export function getBaseBranch(): string {
   return "main";
 }
 
+/** Git's well-known empty tree object, diffed against when there is no base commit */
+const EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904";
+
+/** Output cap for git commands that can return large diffs */
+const GIT_MAX_BUFFER = 10 * 1024 * 1024; // 10MB
+
 /**
- * Get git diff against a reference.
+ * Run git without blocking the event loop, so callers can overlap it with
+ * other git calls or network requests. Never rejects: ok is false when git
+ * exits non-zero or can't be started.
  */
-export function getDiff(ref: string): string {
-  try {
-    const result = spawnSync("git", ["diff", ref], {
-      encoding: "utf-8",
-      maxBuffer: 10 * 1024 * 1024, // 10MB
+export function runGitAsync(args: string[]): Promise<{ ok: boolean; stdout: string }> {
+  return new Promise((done) => {
+    execFile("git", args, { encoding: "utf-8", maxBuffer: GIT_MAX_BUFFER }, (error, stdout) => {
+      done({ ok: error === null, stdout: stdout ?? "" });
     });
+  });
+}
 
-    if (result.status !== 0) {
-      // Fallback to empty tree if ref doesn't exist (fresh repo)
-      const emptyTree = "4b825dc642cb6eb9a060e54bf8d69288fbee4904";
-      const fallback = spawnSync("git", ["diff", emptyTree], {
-        encoding: "utf-8",
-        maxBuffer: 10 * 1024 * 1024,
-      });
-      return fallback.stdout || "(No changes)";
+/**
+ * Stream git output, stopping git as soon as maxLength characters are read
+ * so large diffs are never fully produced, buffered or decoded.
+ * ok is true when git succeeded or was cut off at the limit.
+ */
+function readGitOutput(args: string[], maxLength: number): Promise<{ ok: boolean; stdout: string }> {
+  return new Promise((done) => {
+    const child = spawn("git", args, { stdio: ["ignore", "pipe", "ignore"] });
+    const decoder = new StringDecoder("utf8");
+    let stdout = "";
+    let truncated = false;
+
+    child.stdout.on("data", (chunk: Buffer) => {
+      if (truncated) return;
+      stdout += decoder.write(chunk);
+      if (stdout.length >= maxLength) {
+        truncated = true;
+        stdout = stdout.slice(0, maxLength);
+        child.kill();
+      }
+    });
+    child.on("error", () => done({ ok: false, stdout: "" }));
+    child.on("close", (code) => {
+      done({ ok: truncated || code === 0, stdout: truncated ? stdout : stdout + decoder.end() });
+    });
+  });
+}
+
+/**
+ * Get git diff against a reference, up to maxLength characters.
+ */
+export async function getDiff(ref: string, maxLength: number = GIT_MAX_BUFFER): Promise<string> {
+  const result = await readGitOutput(["diff", await resolveDiffBase(ref)], maxLength);
+  return result.stdout || "(No changes)";
+}
+
+/**
+ * Pick the ref to diff against: the ref itself if it exists, else the empty
+ * tree (fresh repo). Local branches are confirmed from refs on disk; other
+ * refs get a cheap rev-parse instead of a speculative diff that may fail.
+ */
+async function resolveDiffBase(ref: string): Promise<string> {
+  if (listLocalBranches()?.includes(ref)) {
+    return ref;
+  }
+  const verified = await runGitAsync(["rev-parse", "--verify", "--quiet", `${ref}^{commit}`]);
+  return verified.ok ? ref : EMPTY_TREE;
+}
+
+/**
+ * Walk up from start looking for a .git entry, without spawning git.
+ * A .git file marks a linked worktree root, matching rev-parse --show-toplevel.
+ */
+function findGitRoot(start: string): string | null {
+  let dir = resolve(start);
+  for (;;) {
+    if (existsSync(join(dir, ".git"))) {
+      return dir;
     }
+    const parent = dirname(dir);
+    if (parent === dir) {
+      return null;
+    }
+    dir = parent;
+  }
+}
+
+/**
+ * Resolve the git directory for a worktree root, following the gitdir
+ * pointer of linked worktrees. Returns null for a malformed pointer.
+ */
+function resolveGitDir(root: string): string | null {
+  const gitDir = join(root, ".git");
+  if (!statSync(gitDir).isFile()) {
+    return gitDir;
+  }
+  const pointer = readFileSync(gitDir, "utf-8").match(/^gitdir:\s*(.+)$/m);
+  return pointer ? resolve(root, pointer[1].trim()) : null;
+}
+
+/**
+ * Read the current branch straight from HEAD, without spawning git.
+ * Follows the gitdir pointer of linked worktrees. Returns "" for a detached
+ * HEAD (as git branch --show-current does) and null if HEAD can't be read.
+ */
+function readHeadBranch(start: string): string | null {
+  const root = findGitRoot(start);
+  if (root === null) return null;
+
+  try {
+    const gitDir = resolveGitDir(root);
+    if (gitDir === null) return null;
+
+    const head = readFileSync(join(gitDir, "HEAD"), "utf-8").trim();
+    if (head.startsWith("ref: refs/heads/")) {
+      return head.slice("ref: refs/heads/".length);
+    }
+    return head.startsWith("ref:") ? null : "";
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * List local branch names by reading refs/heads and packed-refs directly.
+ * Returns null when refs can't be read this way (e.g. reftable storage),
+ * so callers can fall back to git.
+ */
+export function listLocalBranches(start?: string): string[] | null {
+  const root = findGitRoot(start ?? (process.env.CLAUDE_PROJECT_DIR || process.cwd()));
+  if (root === null) return null;
+
+  try {
+    const gitDir = resolveGitDir(root);
+    if (gitDir === null) return null;
+
+    // Linked worktrees keep shared refs in the common dir
+    const commonDirFile = join(gitDir, "commondir");
+    const commonDir = existsSync(commonDirFile)
+      ? resolve(gitDir, readFileSync(commonDirFile, "utf-8").trim())
+      : gitDir;
+    if (existsSync(join(commonDir, "reftable"))) return null;
 
-    return result.stdout || "(No changes)";
+    const branches = new Set<string>();
+
+    const walk = (dir: string, prefix: string): void => {
+      for (const entry of readdirSync(dir, { withFileTypes: true })) {
+        if (entry.isDirectory()) {
+          walk(join(dir, entry.name), `${prefix}${entry.name}/`);
+        } else if (entry.isFile() && !entry.name.endsWith(".lock")) {
+          branches.add(`${prefix}${entry.name}`);
+        }
+      }
+    };
+    const headsDir = join(commonDir, "refs", "heads");
+    if (existsSync(headsDir)) {
+      walk(headsDir, "");
+    }
+
+    const packedRefs = join(commonDir, "packed-refs");
+    if (existsSync(packedRefs)) {
+      for (const line of readFileSync(packedRefs, "utf-8").split("\n")) {
+        const ref = line.slice(line.indexOf(" ") + 1);
+        if (ref.startsWith("refs/heads/") && !line.startsWith("#") && !line.startsWith("^")) {
+          branches.add(ref.slice("refs/heads/".length).trim());
+        }
+      }
+    }
+
+    return [...branches];
   } catch {
-    return "(Unable to get diff)";
+    return null;
   }
 }
 
+// Project root per starting directory (constant for the life of the process)
+const projectRootCache = new Map<string, string>();
+
 /**
  * Get the project root directory (where .git is located).
  * Uses CLAUDE_PROJECT_DIR if available (for hooks), else current directory.
+ * Cached per starting directory since log() resolves it on every entry.
  */
 export function getProjectRoot(): string {
   const cwd = process.env.CLAUDE_PROJECT_DIR || process.cwd();
-  try {
-    const result = execSync("git rev-parse --show-toplevel", {
-      encoding: "utf-8",
-      cwd,
-    });
-    return result.trim();
-  } catch {
-    return cwd;
+  const cached = projectRootCache.get(cwd);
+  if (cached !== undefined) {
+    return cached;
   }
+
+  let root = findGitRoot(cwd);
+  if (root === null) {
+    try {
+      const result = execFileSync("git", ["rev-parse", "--show-toplevel"], {
+        encoding: "utf-8",
+        cwd,
+      });
+      root = result.trim();
+    } catch {
+      root = cwd;
+    }
+  }
+  projectRootCache.set(cwd, root);
+  return root;
+}
+
+/**
+ * Clear cached project root lookups (for tests or after chdir into a new repo).
+ */
+export function clearProjectRootCache(): void {
+  projectRootCache.clear();
 }
 
 /**
@@ -135,12 +334,12 @@ export function getRepoName(): string {
 }
 
 /**
- * Get the plan directory path for current branch.
+ * Get the plan directory path for a branch (default: current branch).
+ * Callers that already resolved the branch pass it to skip the lookup.
  */
-export function getPlanDir(cwd?: string): string {
+export function getPlanDir(cwd?: string, branch?: string): string {
   const root = cwd ?? getProjectRoot();
-  const branch = getBranch();
-  const planId = sanitizeBranch(branch);
+  const planId = sanitizeBranch(branch ?? getBranch());
   return `${root}/.claude/plans/${planId}`;
 }
 
@@ -4,7 +4,7 @@
 
 // Git utilities
 export {
-  getBaseBranch, getBranch, getDiff, getPlanDir, getProjectRoot, isDirectModeBranch, sanitizeBranch
+  clearBranchCache, clearProjectRootCache, getBaseBranch, getBranch, getDiff, getPlanDir, getProjectRoot, isDirectModeBranch, listLocalBranches, runGitAsync, sanitizeBranch
 } from "./git.js";
 
 // Observability
@@ -27,7 +27,7 @@ export {
 // Markdown utilities
 export {
   parseMarkdownWithFrontMatter, readMarkdownFile,
-  stripLogPlaceholder, writeMarkdownWithFrontMatter
+  stripLogPlaceholder, updateMarkdownFrontMatter, writeMarkdownWithFrontMatter
 } from "./markdown.js";
 
 // Plan file I/O
@@ -85,6 +85,9 @@ export type {
 export { GEMINI_FALLBACKS, ORACLE_FALLBACKS, withRetry } from "./retry.js";
 export type { RetryOptions, RetryResult } from "./retry.js";
 
+// Response cache
+export { DEFAULT_RESPONSE_TTL_MS, readCachedResponse, responseCacheKey, writeCachedResponse } from "./response-cache.js";
+
 // Provider utilities
 export {
   createProvider,
@@ -4,11 +4,11 @@
  */
 
 import { createHash } from "crypto";
-import { existsSync, mkdirSync, readdirSync, readFileSync, statSync, writeFileSync } from "fs";
+import { existsSync, mkdirSync, readdirSync, readFileSync, renameSync, statSync, writeFileSync } from "fs";
 import matter from "gray-matter";
 import { createRequire } from "module";
 import { basename, extname, join, relative } from "path";
-import { Index, MetricKind, ScalarKind } from "usearch";
+import type { Index } from "usearch";
 
 // Create require function for ESM compatibility (needed for fetch caching)
 const require = createRequire(import.meta.url);
@@ -184,7 +184,7 @@ export class KnowledgeService {
 
     this.ensureDir();
     console.error("[knowledge] Loading embedding model...");
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     // Install caching before importing the library
     this.installFetchCache();
@@ -193,7 +193,7 @@ export class KnowledgeService {
     const modelResult = await TextModel.create("gtr-t5-quant");
     this.model = modelResult.model;
 
-    console.error(`[knowledge] Model loaded in ${((Date.now() - startTime) / 1000).toFixed(1)}s`);
+    console.error(`[knowledge] Model loaded in ${((performance.now() - startTime) / 1000).toFixed(1)}s`);
     return this.model;
   }
 
@@ -240,9 +240,10 @@ export class KnowledgeService {
   }
 
   /**
-   * Create a new USearch index
+   * Create a new USearch index (native module loaded on first use)
    */
-  private createIndex(): Index {
+  private async createIndex(): Promise<Index> {
+    const { Index, MetricKind, ScalarKind } = await import("usearch");
     return new Index(
       768,                // dimensions
       MetricKind.Cos,     // metric
@@ -259,12 +260,12 @@ export class KnowledgeService {
 
     if (!existsSync(paths.index) || !existsSync(paths.meta)) {
       return {
-        index: this.createIndex(),
+        index: await this.createIndex(),
         meta: this.createEmptyMetadata(),
       };
     }
 
-    const index = this.createIndex();
+    const index = await this.createIndex();
     index.load(paths.index);
 
     const meta: IndexMetadata = JSON.parse(readFileSync(paths.meta, "utf-8"));
@@ -280,7 +281,12 @@ export class KnowledgeService {
 
     meta.lastUpdated = new Date().toISOString();
     index.save(paths.index);
-    writeFileSync(paths.meta, JSON.stringify(meta, null, 2));
+
+    // Compact JSON written to a temp file and renamed, so a crash never leaves
+    // metadata half-written or out of step with the saved index
+    const tmpPath = `${paths.meta}.tmp`;
+    writeFileSync(tmpPath, JSON.stringify(meta));
+    renameSync(tmpPath, paths.meta);
   }
 
   /**
@@ -448,11 +454,11 @@ export class KnowledgeService {
    */
   async reindexAll(): Promise<ReindexResult> {
     this.ensureDir();
-    const startTime = Date.now();
+    const startTime = performance.now();
     console.error("[knowledge] Reindexing docs...");
 
     // Create fresh index
-    const index = this.createIndex();
+    const index = await this.createIndex();
     const meta = this.createEmptyMetadata();
 
     // Discover and index files
@@ -483,7 +489,7 @@ export class KnowledgeService {
 
     // Save
     await this.saveIndex(index, meta);
-    const duration = ((Date.now() - startTime) / 1000).toFixed(1);
+    const duration = ((performance.now() - startTime) / 1000).toFixed(1);
     console.error(`[knowledge] Reindex complete: ${files.length} files, ${totalTokens} tokens in ${duration}s`);
 
     return {
@@ -501,7 +507,7 @@ export class KnowledgeService {
     files: { path: string; action: string }[];
   }> {
     console.error(`[knowledge] Incremental reindex: ${changes.length} change(s)`);
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     const { index, meta } = await this.loadIndex();
     const processedFiles: { path: string; action: string }[] = [];
@@ -555,7 +561,7 @@ export class KnowledgeService {
 
     // Save updated index
     await this.saveIndex(index, meta);
-    const duration = ((Date.now() - startTime) / 1000).toFixed(1);
+    const duration = ((performance.now() - startTime) / 1000).toFixed(1);
     console.error(`[knowledge] Incremental reindex complete: ${processedFiles.length} file(s) in ${duration}s`);
 
     return {
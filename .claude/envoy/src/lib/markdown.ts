@@ -2,9 +2,28 @@
  * Markdown with YAML front matter parsing utilities.
  */
 
-import { existsSync, readFileSync, writeFileSync } from "fs";
+import { closeSync, fstatSync, ftruncateSync, openSync, readFileSync, readSync, statSync, writeFileSync, writeSync } from "fs";
 import { parse as parseYaml, stringify as stringifyYaml } from "yaml";
 
+/** Leading YAML front matter block and the remaining body */
+const FRONT_MATTER_PATTERN = /^---\r?\n([\s\S]*?)\r?\n---\r?\n([\s\S]*)$/;
+
+/** Front matter block alone, for rewriting it without touching the body */
+const FRONT_MATTER_BLOCK_PATTERN = /^---\r?\n([\s\S]*?)\r?\n---\r?\n/;
+
+/** Initial read size when looking for the end of a front matter block */
+const FRONT_MATTER_READ_BYTES = 4096;
+
+/** Parsed markdown per path, valid while the file's mtime and size are unchanged */
+const parsedFileCache = new Map<
+  string,
+  {
+    mtimeNs: bigint;
+    size: bigint;
+    parsed: { frontMatter: Record<string, unknown>; content: string };
+  }
+>();
+
 /**
  * Parse a markdown file with YAML front matter.
  * Returns { frontMatter: object, content: string }
@@ -13,7 +32,7 @@ export function parseMarkdownWithFrontMatter(text: string): {
   frontMatter: Record<string, unknown>;
   content: string;
 } {
-  const match = text.match(/^---\r?\n([\s\S]*?)\r?\n---\r?\n([\s\S]*)$/);
+  const match = text.match(FRONT_MATTER_PATTERN);
   if (!match) {
     return { frontMatter: {}, content: text };
   }
@@ -36,21 +55,93 @@ export function writeMarkdownWithFrontMatter(
   const yaml = stringifyYaml(frontMatter, { lineWidth: 0 });
   const fileContent = `---\n${yaml}---\n\n${content}`;
   writeFileSync(filePath, fileContent, "utf-8");
+  parsedFileCache.delete(filePath);
+}
+
+/**
+ * Rewrite only the front matter of a markdown file, leaving the body bytes untouched.
+ * Overwrites in place when the new block has the same length, else rewrites the file.
+ * Returns false if the file doesn't exist or has no parseable front matter.
+ */
+export function updateMarkdownFrontMatter(
+  filePath: string,
+  update: (frontMatter: Record<string, unknown>) => Record<string, unknown>
+): boolean {
+  let fd: number;
+  try {
+    fd = openSync(filePath, "r+");
+  } catch {
+    return false;
+  }
+
+  try {
+    const size = fstatSync(fd).size;
+
+    // Read just enough of the file to contain the front matter block
+    let window = Math.min(size, FRONT_MATTER_READ_BYTES);
+    let match: RegExpMatchArray | null = null;
+    for (;;) {
+      const head = Buffer.alloc(window);
+      readSync(fd, head, 0, window, 0);
+      match = head.toString("utf-8").match(FRONT_MATTER_BLOCK_PATTERN);
+      if (match || window === size) break;
+      window = Math.min(size, window * 2);
+    }
+    if (!match) return false;
+
+    let frontMatter: Record<string, unknown>;
+    try {
+      frontMatter = (parseYaml(match[1]) ?? {}) as Record<string, unknown>;
+    } catch {
+      return false;
+    }
+
+    const yaml = stringifyYaml(update(frontMatter), { lineWidth: 0 });
+    const header = Buffer.from(`---\n${yaml}---\n`, "utf-8");
+    const oldHeaderLength = Buffer.byteLength(match[0], "utf-8");
+
+    if (header.length === oldHeaderLength) {
+      writeSync(fd, header, 0, header.length, 0);
+    } else {
+      const body = Buffer.alloc(size - oldHeaderLength);
+      readSync(fd, body, 0, body.length, oldHeaderLength);
+      const updated = Buffer.concat([header, body]);
+      ftruncateSync(fd, 0);
+      writeSync(fd, updated, 0, updated.length, 0);
+    }
+    parsedFileCache.delete(filePath);
+    return true;
+  } finally {
+    closeSync(fd);
+  }
 }
 
 /**
  * Read a markdown file and parse front matter.
  * Returns null if file doesn't exist.
+ * Repeat reads of an unchanged file (same mtime and size) skip the read and YAML parse.
  */
 export function readMarkdownFile(filePath: string): {
   frontMatter: Record<string, unknown>;
   content: string;
 } | null {
-  if (!existsSync(filePath)) {
+  let stat;
+  try {
+    stat = statSync(filePath, { bigint: true });
+  } catch {
     return null;
   }
+
+  const cached = parsedFileCache.get(filePath);
+  if (cached && cached.mtimeNs === stat.mtimeNs && cached.size === stat.size) {
+    // Callers may mutate the result, so hand out a copy
+    return structuredClone(cached.parsed);
+  }
+
   const text = readFileSync(filePath, "utf-8");
-  return parseMarkdownWithFrontMatter(text);
+  const parsed = parseMarkdownWithFrontMatter(text);
+  parsedFileCache.set(filePath, { mtimeNs: stat.mtimeNs, size: stat.size, parsed });
+  return structuredClone(parsed);
 }
 
 /**
@@ -3,10 +3,13 @@
  * Log-based tracing via envoy.log.
  */
 
-import { appendFileSync, mkdirSync, existsSync } from "fs";
+import { existsSync, mkdirSync, openSync, writeSync } from "fs";
 import { join } from "path";
 import { getProjectRoot, getBranch } from "./git.js";
 
+/** Worktree branch suffix: captures the parent plan branch before /implementation-* */
+const IMPLEMENTATION_BRANCH_PATTERN = /^(.+?)\/implementation-/;
+
 /**
  * Derive plan_name from branch.
  * Worktree branches follow pattern: feature-foo/implementation-1-A
@@ -16,7 +19,7 @@ export function getPlanName(branch?: string | null): string | undefined {
   const b = branch ?? getBranch();
   if (!b) return undefined;
   // Strip /implementation-* suffix if present
-  const match = b.match(/^(.+?)\/implementation-/);
+  const match = b.match(IMPLEMENTATION_BRANCH_PATTERN);
   return match ? match[1] : b;
 }
 
@@ -74,6 +77,25 @@ function getLogPath(): string {
   return join(getObservabilityDir(), "envoy.log");
 }
 
+// --- Log File Handle ---
+
+// Append-mode descriptor per log path, opened on first write and kept for the process
+const logFds = new Map<string, number>();
+
+/**
+ * Get (opening once) an append-mode descriptor for the log file.
+ */
+function getLogFd(): number {
+  const path = getLogPath();
+  let fd = logFds.get(path);
+  if (fd === undefined) {
+    ensureObservabilityDir();
+    fd = openSync(path, "a");
+    logFds.set(path, fd);
+  }
+  return fd;
+}
+
 // --- Ensure Directory Exists ---
 
 function ensureObservabilityDir(): void {
@@ -83,56 +105,31 @@ function ensureObservabilityDir(): void {
   }
 }
 
-// --- String Trimming ---
+// --- Sanitizing ---
 
 /**
- * Recursively trim all strings in an object/array to max length.
- * Adds ellipsis when truncated. Handles circular references.
+ * Trim a string to max length, adding ellipsis when truncated.
  */
-function trimStrings(
-  value: unknown,
-  maxLen = MAX_LOG_STRING_LENGTH,
-  visited = new WeakSet<object>()
-): unknown {
-  if (value === null || value === undefined) return value;
-
-  if (typeof value === "string") {
-    return value.length > maxLen ? value.slice(0, maxLen) + "..." : value;
-  }
-
-  if (Array.isArray(value)) {
-    if (visited.has(value)) return "[Circular Reference]";
-    visited.add(value);
-    return value.map((item) => trimStrings(item, maxLen, visited));
-  }
-
-  if (typeof value === "object") {
-    if (visited.has(value)) return "[Circular Reference]";
-    visited.add(value);
-    const result: Record<string, unknown> = {};
-    for (const [k, v] of Object.entries(value)) {
-      result[k] = trimStrings(v, maxLen, visited);
-    }
-    return result;
-  }
-
-  return value;
+function trimString(value: string, maxLen = MAX_LOG_STRING_LENGTH): string {
+  return value.length > maxLen ? value.slice(0, maxLen) + "..." : value;
 }
 
 /**
- * Truncate deep/wide structures to prevent log bloat.
+ * Truncate deep/wide structures and trim strings in a single pass,
+ * so each log entry builds only one sanitized copy.
  * Summarizes arrays beyond maxItems and objects beyond maxKeys.
  * At maxDepth, replaces nested structures with summary strings.
  */
-function truncateStructure(
+function sanitizeForLog(
   value: unknown,
   maxDepth = MAX_LOG_DEPTH,
   maxArrayItems = MAX_LOG_ARRAY_ITEMS,
   maxObjectKeys = MAX_LOG_OBJECT_KEYS,
   visited = new WeakSet<object>()
 ): unknown {
-  const truncate = (val: unknown, depth: number): unknown => {
+  const sanitize = (val: unknown, depth: number): unknown => {
     if (val === null || val === undefined) return val;
+    if (typeof val === "string") return trimString(val);
     if (typeof val !== "object") return val;
 
     // Circular reference check
@@ -141,13 +138,13 @@ function truncateStructure(
 
     if (Array.isArray(val)) {
       if (val.length === 0) return [];
-      if (depth >= maxDepth) return `[${val.length} items]`;
+      if (depth >= maxDepth) return trimString(`[${val.length} items]`);
 
       const items = val
         .slice(0, maxArrayItems)
-        .map((v) => truncate(v, depth + 1));
+        .map((v) => sanitize(v, depth + 1));
       if (val.length > maxArrayItems) {
-        items.push(`...+${val.length - maxArrayItems} more`);
+        items.push(trimString(`...+${val.length - maxArrayItems} more`));
       }
       return items;
     }
@@ -155,13 +152,13 @@ function truncateStructure(
     // Object
     const keys = Object.keys(val as Record<string, unknown>);
     if (keys.length === 0) return {};
-    if (depth >= maxDepth) return `{${keys.length} fields}`;
+    if (depth >= maxDepth) return trimString(`{${keys.length} fields}`);
 
     const result: Record<string, unknown> = {};
     const keysToInclude = keys.slice(0, maxObjectKeys);
 
     for (const k of keysToInclude) {
-      result[k] = truncate((val as Record<string, unknown>)[k], depth + 1);
+      result[k] = sanitize((val as Record<string, unknown>)[k], depth + 1);
     }
 
     if (keys.length > maxObjectKeys) {
@@ -171,7 +168,7 @@ function truncateStructure(
     return result;
   };
 
-  return truncate(value, 0);
+  return sanitize(value, 0);
 }
 
 // --- Logging ---
@@ -180,23 +177,18 @@ function truncateStructure(
  * Write a log entry to envoy.log.
  */
 export function log(entry: Omit<LogEntry, "timestamp">): void {
-  ensureObservabilityDir();
   const branch = getBranch() || undefined;
 
-  // Apply structure truncation first (depth/breadth), then string trimming
-  const sanitize = (obj: Record<string, unknown>): Record<string, unknown> =>
-    trimStrings(truncateStructure(obj)) as Record<string, unknown>;
-
   const fullEntry: LogEntry = {
     timestamp: new Date().toISOString(),
     branch,
     plan_name: getPlanName(branch),
     ...entry,
-    args: entry.args ? sanitize(entry.args) : undefined,
-    context: entry.context ? sanitize(entry.context) : undefined,
+    args: entry.args ? (sanitizeForLog(entry.args) as Record<string, unknown>) : undefined,
+    context: entry.context ? (sanitizeForLog(entry.context) as Record<string, unknown>) : undefined,
   };
   try {
-    appendFileSync(getLogPath(), JSON.stringify(fullEntry) + "\n");
+    writeSync(getLogFd(), JSON.stringify(fullEntry) + "\n");
   } catch {
     // Silent fail - observability should not break commands
   }
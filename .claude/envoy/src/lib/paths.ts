@@ -18,14 +18,23 @@ const PLAN_SUBDIRS = [
   "user_feedback",
 ];
 
+// Plan directories already verified or created by this process
+const knownPlanDirs = new Set<string>();
+
+/** Prompt identifiers: "1", "2_A", "3_B" */
+const PROMPT_ID_PATTERN = /^(\d+)(?:_([A-Z]))?$/;
+
 /**
  * Ensure the plan directory exists with all required subdirectories.
- * Creates on demand if not present.
+ * Creates on demand if not present; repeat calls skip the existence check.
  *
  * @returns The plan directory path
  */
 export function ensurePlanDir(): string {
   const planDir = getPlanDir();
+  if (knownPlanDirs.has(planDir)) {
+    return planDir;
+  }
 
   if (!existsSync(planDir)) {
     logInfo("plans.create_dir", { path: planDir });
@@ -37,6 +46,7 @@ export function ensurePlanDir(): string {
       mkdirSync(subdirPath, { recursive: true });
     }
   }
+  knownPlanDirs.add(planDir);
 
   return planDir;
 }
@@ -95,10 +105,10 @@ export function getUserFeedbackPath(id: string, ext: string = ".yaml"): string {
 }
 
 /**
- * Check if a plan directory exists for the current branch.
+ * Check if a plan directory exists for a branch (default: current branch).
  */
-export function planExists(): boolean {
-  return existsSync(getPlanDir());
+export function planExists(branch?: string): boolean {
+  return existsSync(getPlanDir(undefined, branch));
 }
 
 /**
@@ -112,7 +122,7 @@ export function getPromptId(number: number, variant: string | null): string {
  * Parse prompt identifier string into number and variant.
  */
 export function parsePromptId(id: string): { number: number; variant: string | null } {
-  const match = id.match(/^(\d+)(?:_([A-Z]))?$/);
+  const match = id.match(PROMPT_ID_PATTERN);
   if (!match) {
     throw new Error(`Invalid prompt identifier: ${id}`);
   }
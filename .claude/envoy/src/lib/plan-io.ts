@@ -2,10 +2,10 @@
  * Plan file I/O operations.
  */
 
-import { existsSync, readFileSync, writeFileSync, appendFileSync } from "fs";
+import { closeSync, existsSync, fstatSync, openSync, readFileSync, writeFileSync, writeSync } from "fs";
 import { getBranch } from "./git.js";
 import { ensurePlanDir, getPlanPaths } from "./paths.js";
-import { readMarkdownFile, writeMarkdownWithFrontMatter } from "./markdown.js";
+import { readMarkdownFile, updateMarkdownFrontMatter, writeMarkdownWithFrontMatter } from "./markdown.js";
 
 export interface PlanFrontMatter {
   stage: "draft" | "in_progress" | "completed";
@@ -59,12 +59,13 @@ export function writePlan(frontMatter: Partial<PlanFrontMatter>, content: string
  * Update plan stage without modifying content.
  */
 export function updatePlanStage(stage: PlanFrontMatter["stage"]): void {
+  const paths = getPlanPaths();
+  if (updateMarkdownFrontMatter(paths.plan, (frontMatter) => ({ ...frontMatter, stage }))) return;
+
+  // No (parseable) front matter block to patch: rewrite the whole file with one
   const plan = readPlan();
   if (!plan) return;
-
-  const updatedFrontMatter = { ...plan.frontMatter, stage };
-  const paths = getPlanPaths();
-  writeMarkdownWithFrontMatter(paths.plan, updatedFrontMatter, plan.content);
+  writeMarkdownWithFrontMatter(paths.plan, { ...plan.frontMatter, stage }, plan.content);
 }
 
 /**
@@ -85,15 +86,18 @@ export function appendUserInput(content: string): void {
   const paths = getPlanPaths();
   ensurePlanDir();
 
-  // Initialize file if it doesn't exist
-  if (!existsSync(paths.userInput)) {
-    writeFileSync(paths.userInput, "# User Input Log\n\n", "utf-8");
-  }
-
   // Append with timestamp
   const timestamp = new Date().toISOString();
   const entry = `\n---\n**${timestamp}**\n\n${content}\n`;
-  appendFileSync(paths.userInput, entry, "utf-8");
+
+  // Single open + write; a new (empty) file gets the log header first
+  const fd = openSync(paths.userInput, "a");
+  try {
+    const header = fstatSync(fd).size === 0 ? "# User Input Log\n\n" : "";
+    writeSync(fd, header + entry, null, "utf-8");
+  } finally {
+    closeSync(fd);
+  }
 }
 
 /**
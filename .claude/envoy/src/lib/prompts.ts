@@ -4,9 +4,12 @@
 
 import { existsSync, mkdirSync, readdirSync, unlinkSync } from "fs";
 import { join } from "path";
-import { ensurePlanDir, getPlanPaths, getPromptPath } from "./paths.js";
+import { ensurePlanDir, getPlanPaths, getPromptId, getPromptPath } from "./paths.js";
 import { readMarkdownFile, writeMarkdownWithFrontMatter } from "./markdown.js";
 
+/** Prompt file names: 1.md, 1_A.md, 12.md, 12_B.md */
+const PROMPT_FILE_PATTERN = /^(\d+)(?:_([A-Z]))?\.md$/;
+
 export interface PromptFrontMatter {
   number: number;
   variant: string | null;
@@ -108,7 +111,7 @@ export function writePrompt(
 
   const defaults = createDefaultPromptFrontMatter(number, variant);
   const merged = { ...defaults, ...frontMatter };
-  const promptPath = getPromptPath(number, variant);
+  const promptPath = join(paths.prompts, `${getPromptId(number, variant)}.md`);
   writeMarkdownWithFrontMatter(promptPath, merged, content);
 }
 
@@ -142,8 +145,7 @@ export function listPrompts(): Array<{
   const prompts: Array<{ number: number; variant: string | null; path: string }> = [];
 
   for (const file of files) {
-    // Match patterns: 1.md, 1_A.md, 12.md, 12_B.md
-    const match = file.match(/^(\d+)(?:_([A-Z]))?\.md$/);
+    const match = file.match(PROMPT_FILE_PATTERN);
     if (match) {
       prompts.push({
         number: parseInt(match[1], 10),
@@ -178,13 +180,15 @@ export function readAllPrompts(): Array<{
     content: string;
   }> = [];
 
+  // Read via the paths listPrompts already built instead of re-deriving each one
   for (const prompt of promptList) {
-    const data = readPrompt(prompt.number, prompt.variant);
+    const data = readMarkdownFile(prompt.path);
     if (data) {
       results.push({
         number: prompt.number,
         variant: prompt.variant,
-        ...data,
+        frontMatter: data.frontMatter as unknown as PromptFrontMatter,
+        content: data.content,
       });
     }
   }
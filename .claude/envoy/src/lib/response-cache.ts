@@ -0,0 +1,134 @@
+/**
+ * Content-addressed on-disk cache for external LLM responses.
+ * Identical (provider, model, prompt) inputs replay the stored response
+ * instead of repeating the network round-trip. Commands use it only when
+ * run with --cache. Entries expire after a TTL and the cache directory is
+ * kept under a total size cap.
+ */
+
+import { createHash } from "crypto";
+import { mkdirSync, readdirSync, readFileSync, renameSync, statSync, unlinkSync, writeFileSync } from "fs";
+import { dirname, join } from "path";
+import { getProjectRoot } from "./git.js";
+
+/** Default lifetime of a cached response (24h) */
+export const DEFAULT_RESPONSE_TTL_MS = 24 * 60 * 60 * 1000;
+
+/** Total size the cache may reach before the oldest entries are evicted */
+const MAX_CACHE_BYTES = 50 * 1024 * 1024;
+
+/** Pruning goes below the cap so the next scan is another ~10 MB of writes away */
+const PRUNE_TARGET_BYTES = 40 * 1024 * 1024;
+
+/**
+ * Hash request inputs into a cache key. Parts are NUL-separated so
+ * adjacent values cannot collide by concatenation.
+ */
+export function responseCacheKey(...parts: unknown[]): string {
+  const hash = createHash("sha256");
+  for (const part of parts) {
+    hash.update(typeof part === "string" ? part : JSON.stringify(part));
+    hash.update("\0");
+  }
+  return hash.digest("hex");
+}
+
+/** Running byte count of the cache, so writes don't rescan the directory */
+const SIZE_FILE = ".size";
+
+function getCacheDir(): string {
+  return join(getProjectRoot(), ".claude", ".cache", "llm");
+}
+
+function getCachePath(key: string): string {
+  return join(getCacheDir(), key.slice(0, 2), `${key}.json`);
+}
+
+/**
+ * Read a cached response. Returns null on miss, unreadable entry, or an
+ * entry older than ttlMs (which is removed).
+ */
+export function readCachedResponse<T>(key: string, ttlMs = DEFAULT_RESPONSE_TTL_MS): T | null {
+  const path = getCachePath(key);
+  try {
+    if (Date.now() - statSync(path).mtimeMs > ttlMs) {
+      unlinkSync(path);
+      return null;
+    }
+    return JSON.parse(readFileSync(path, "utf-8")) as T;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Store a response atomically (write temp file, then rename), then evict
+ * the oldest entries if the cache has grown past its size cap.
+ * Caching is best-effort; write failures are ignored.
+ */
+export function writeCachedResponse(key: string, value: unknown): void {
+  const path = getCachePath(key);
+  const tmpPath = `${path}.${process.pid}.tmp`;
+  try {
+    mkdirSync(dirname(path), { recursive: true });
+    const body = JSON.stringify(value);
+    writeFileSync(tmpPath, body);
+    renameSync(tmpPath, path);
+    recordWrite(Buffer.byteLength(body));
+  } catch {
+    // Ignore - a missed cache write only costs a future API call
+  }
+}
+
+/**
+ * Add a write to the size counter and prune only once it passes the cap.
+ * The counter over-counts overwrites and expired entries, so it is reset
+ * to the real total after each prune. A missing counter is seeded by a scan.
+ */
+function recordWrite(bytes: number): void {
+  const sizePath = join(getCacheDir(), SIZE_FILE);
+  let total: number;
+  try {
+    total = parseInt(readFileSync(sizePath, "utf-8"), 10) + bytes;
+  } catch {
+    total = Number.NaN;
+  }
+  if (Number.isNaN(total) || total > MAX_CACHE_BYTES) {
+    total = pruneCache();
+  }
+  writeFileSync(sizePath, String(total));
+}
+
+/**
+ * Delete oldest entries (by mtime) once the cache exceeds MAX_CACHE_BYTES,
+ * down to PRUNE_TARGET_BYTES. Returns the remaining total size in bytes.
+ */
+function pruneCache(): number {
+  const cacheDir = getCacheDir();
+  const entries: Array<{ path: string; size: number; mtimeMs: number }> = [];
+  let total = 0;
+  for (const shard of readdirSync(cacheDir)) {
+    if (shard === SIZE_FILE) continue;
+    const shardDir = join(cacheDir, shard);
+    for (const name of readdirSync(shardDir)) {
+      if (!name.endsWith(".json")) continue;
+      const path = join(shardDir, name);
+      const { size, mtimeMs } = statSync(path);
+      entries.push({ path, size, mtimeMs });
+      total += size;
+    }
+  }
+  if (total <= MAX_CACHE_BYTES) return total;
+
+  entries.sort((a, b) => a.mtimeMs - b.mtimeMs);
+  for (const entry of entries) {
+    if (total <= PRUNE_TARGET_BYTES) break;
+    try {
+      unlinkSync(entry.path);
+      total -= entry.size;
+    } catch {
+      // Already removed by a concurrent process
+    }
+  }
+  return total;
+}
@@ -383,7 +383,11 @@ export async function getFileComplexity(filePath: string): Promise<{
 
   try {
     const content = readFileSync(filePath, "utf-8");
-    const lines = content.split("\n").length;
+    // Count newlines instead of materialising every line just to take the length
+    let lines = 1;
+    for (let i = content.indexOf("\n"); i !== -1; i = content.indexOf("\n", i + 1)) {
+      lines++;
+    }
 
     const result = await parseFile(filePath);
     if (!result.success || !result.symbols) {
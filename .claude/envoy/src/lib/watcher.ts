@@ -3,7 +3,7 @@
  * Uses chokidar for cross-platform file watching.
  */
 
-import chokidar, { type FSWatcher } from "chokidar";
+import type { FSWatcher } from "chokidar";
 import { readFileSync, existsSync } from "fs";
 import { parse as parseYaml } from "yaml";
 import { logInfo, logWarn } from "./observability.js";
@@ -26,6 +26,7 @@ export async function watchForDone(
   timeoutMs?: number
 ): Promise<WatchResult> {
   const start = performance.now();
+  const { watch } = await import("chokidar");
 
   return new Promise((resolve, reject) => {
     let timeoutId: NodeJS.Timeout | undefined;
@@ -50,7 +51,7 @@ export async function watchForDone(
 
     logInfo("watcher.start", { filePath, timeoutMs });
 
-    const watcher = chokidar.watch(filePath, {
+    const watcher = watch(filePath, {
       persistent: true,
       ignoreInitial: false,
       awaitWriteFinish: {
@@ -113,6 +114,7 @@ export async function watchForAnyDone(
   timeoutMs?: number
 ): Promise<WatchResult & { triggeredFile: string }> {
   const start = performance.now();
+  const { watch } = await import("chokidar");
 
   return new Promise((resolve, reject) => {
     let timeoutId: NodeJS.Timeout | undefined;
@@ -131,7 +133,7 @@ export async function watchForAnyDone(
     }
 
     for (const filePath of filePaths) {
-      const watcher = chokidar.watch(filePath, {
+      const watcher = watch(filePath, {
         persistent: true,
         ignoreInitial: false,
         awaitWriteFinish: {
@@ -3,7 +3,7 @@
 import json
 import sys
 
-data = json.load(sys.stdin)
+data = json.loads(sys.stdin.buffer.read())
 url = data.get("tool_input", {}).get("url", "")
 
 if not url:
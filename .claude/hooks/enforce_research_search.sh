@@ -0,0 +1,5 @@
+#!/bin/bash
+# PreToolUse hook: block WebSearch for non-research agents
+
+# Always deny - the response is constant, so no interpreter is needed
+echo '{"hookSpecificOutput": {"hookEventName": "PreToolUse", "permissionDecision": "deny", "permissionDecisionReason": "WebSearch blocked. Main agent: delegate to researcher agent. Subagent: respond to main agent requesting researcher delegation."}}'
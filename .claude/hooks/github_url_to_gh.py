@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
 """PreToolUse hook: block GitHub URLs in fetch commands - suggest gh CLI instead."""
 import json
+import re
 import sys
+from urllib.parse import urlsplit
 
 GITHUB_DOMAINS = ("github.com", "raw.githubusercontent.com", "gist.github.com")
+GITHUB_HOSTS = frozenset(GITHUB_DOMAINS)
+# Subdomains (api.github.com, codeload.github.com, www.github.com, ...) match by suffix
+GITHUB_HOST_SUFFIXES = tuple("." + d for d in GITHUB_DOMAINS)
+
+# Compiled once so each Bash check is a single C-level scan per pattern
+FETCH_CMD_RE = re.compile(r"curl|wget|tavily extract")
+GITHUB_DOMAIN_RE = re.compile("|".join(re.escape(d) for d in GITHUB_DOMAINS))
 
 def deny(reason):
     print(json.dumps({
@@ -15,16 +24,24 @@ def deny(reason):
     }))
     sys.exit(0)
 
-data = json.load(sys.stdin)
+data = json.loads(sys.stdin.buffer.read())
 tool_name = data.get("tool_name", "")
 tool_input = data.get("tool_input", {})
 
 # Check WebFetch URLs
 if tool_name == "WebFetch":
     url = tool_input.get("url", "")
-    for domain in GITHUB_DOMAINS:
-        if domain in url:
-            deny("GitHub URL detected. Use 'gh' CLI: gh api repos/OWNER/REPO/contents/PATH")
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        host = ""
+    if host:
+        is_github = host in GITHUB_HOSTS or host.endswith(GITHUB_HOST_SUFFIXES)
+    else:
+        # Unparseable or scheme-less URL (github.com/o/r): fall back to a plain substring check
+        is_github = GITHUB_DOMAIN_RE.search(url) is not None
+    if is_github:
+        deny("GitHub URL detected. Use 'gh' CLI: gh api repos/OWNER/REPO/contents/PATH")
     sys.exit(0)
 
 # Check Bash commands for curl, wget, envoy tavily extract
@@ -32,13 +49,11 @@ if tool_name == "Bash":
     command = tool_input.get("command", "")
 
     # Check for fetch-like commands
-    is_fetch_cmd = any(cmd in command for cmd in ["curl", "wget", "tavily extract"])
-    if not is_fetch_cmd:
+    if not FETCH_CMD_RE.search(command):
         sys.exit(0)
 
     # Check for GitHub URLs
-    for domain in GITHUB_DOMAINS:
-        if domain in command:
-            deny("GitHub URL detected. Use 'gh' CLI: gh api repos/OWNER/REPO/contents/PATH")
+    if GITHUB_DOMAIN_RE.search(command):
+        deny("GitHub URL detected. Use 'gh' CLI: gh api repos/OWNER/REPO/contents/PATH")
 
 sys.exit(0)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Validate agent files on startup."""
 import json
+import os
 import re
 import sys
 from pathlib import Path
@@ -9,20 +10,24 @@ from typing import Optional
 AGENTS_DIR = Path(".claude/agents")
 SKILLS_DIR = Path(".claude/skills")
 
+# Frontmatter block at the start of the file, matched on raw bytes
+FRONTMATTER_RE = re.compile(rb"---\n(.*?)\n---", re.DOTALL)
 
-def parse_frontmatter(content: str) -> Optional[dict]:
-    """Parse YAML frontmatter from markdown file."""
-    if not content.startswith("---"):
-        return None
-    match = re.search(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+# Only the fields this hook checks; later lines override earlier ones
+FIELD_RE = re.compile(rb"^[^\S\n]*(name|description|skills)[^\S\n]*:[^\S\n]*(.*?)\s*$", re.MULTILINE)
+
+
+def parse_frontmatter(data: bytes) -> Optional[dict]:
+    """Extract checked fields from markdown frontmatter.
+
+    Returns None when there is no frontmatter or it has no key: value lines.
+    """
+    # Universal newlines, as read_text() gave, so CRLF files parse too
+    data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    match = FRONTMATTER_RE.match(data)
+    if not match or b":" not in match.group(1):
         return None
-    fm = {}
-    for line in match.group(1).split("\n"):
-        if ":" in line:
-            k, v = line.split(":", 1)
-            fm[k.strip()] = v.strip()
-    return fm
+    return {k.decode(): v.decode() for k, v in FIELD_RE.findall(match.group(1))}
 
 
 def main():
@@ -31,12 +36,14 @@ def main():
     if not AGENTS_DIR.exists():
         sys.exit(0)
 
+    # One listdir instead of a stat per skill reference
+    skill_names = set(os.listdir(SKILLS_DIR)) if SKILLS_DIR.is_dir() else set()
+
     for f in AGENTS_DIR.glob("*.md"):
-        content = f.read_text()
-        fm = parse_frontmatter(content)
+        fm = parse_frontmatter(f.read_bytes())
         name = f.stem
 
-        if not fm:
+        if fm is None:
             errors.append(f"⚠️ agent/{f.name}: missing frontmatter")
             continue
 
@@ -50,7 +57,7 @@ def main():
         if "skills" in fm:
             for skill in fm["skills"].split(","):
                 skill = skill.strip()
-                if skill and not (SKILLS_DIR / skill).exists():
+                if skill and skill not in skill_names:
                     errors.append(f"⚠️ agent/{f.name}: skill '{skill}' not found")
 
     if errors:
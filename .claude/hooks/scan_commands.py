@@ -8,20 +8,24 @@ from typing import Optional
 
 COMMANDS_DIR = Path(".claude/commands")
 
+# Frontmatter block at the start of the file, matched on raw bytes
+FRONTMATTER_RE = re.compile(rb"---\n(.*?)\n---", re.DOTALL)
 
-def parse_frontmatter(content: str) -> Optional[dict]:
-    """Parse YAML frontmatter from markdown file."""
-    if not content.startswith("---"):
-        return None
-    match = re.search(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+# Only the field this hook checks; later lines override earlier ones
+FIELD_RE = re.compile(rb"^[^\S\n]*(description)[^\S\n]*:[^\S\n]*(.*?)\s*$", re.MULTILINE)
+
+
+def parse_frontmatter(data: bytes) -> Optional[dict]:
+    """Extract checked fields from markdown frontmatter.
+
+    Returns None when there is no frontmatter or it has no key: value lines.
+    """
+    # Universal newlines, as read_text() gave, so CRLF files parse too
+    data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    match = FRONTMATTER_RE.match(data)
+    if not match or b":" not in match.group(1):
         return None
-    fm = {}
-    for line in match.group(1).split("\n"):
-        if ":" in line:
-            k, v = line.split(":", 1)
-            fm[k.strip()] = v.strip()
-    return fm
+    return {k.decode(): v.decode() for k, v in FIELD_RE.findall(match.group(1))}
 
 
 def main():
@@ -31,10 +35,9 @@ def main():
         sys.exit(0)
 
     for f in COMMANDS_DIR.glob("*.md"):
-        content = f.read_text()
-        fm = parse_frontmatter(content)
+        fm = parse_frontmatter(f.read_bytes())
 
-        if not fm:
+        if fm is None:
             errors.append(f"⚠️ command/{f.name}: missing frontmatter")
             continue
 
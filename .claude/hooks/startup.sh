@@ -35,10 +35,6 @@ if [ -n "$branch" ]; then
         # Feature branch - ensure plan directory exists
         "$CLAUDE_PROJECT_DIR/.claude/envoy/envoy" plan init > /dev/null 2>&1
 
-        # Get plan stage
-        result=$("$CLAUDE_PROJECT_DIR/.claude/envoy/envoy" plan check 2>/dev/null)
-        stage=$(echo "$result" | python3 -c "import sys,json; d=json.load(sys.stdin); print(d.get('data',{}).get('stage',''))" 2>/dev/null)
-
         plan_id=$(echo "$branch" | sed 's/[^a-zA-Z0-9_-]/-/g')
         plan_file=".claude/plans/$plan_id/plan.md"
 
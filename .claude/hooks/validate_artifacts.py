@@ -3,6 +3,7 @@
 import json
 import re
 import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -10,31 +11,63 @@ AGENTS_DIR = Path(".claude/agents")
 SKILLS_DIR = Path(".claude/skills")
 COMMANDS_DIR = Path(".claude/commands")
 
+# Frontmatter sits at the top of the file; read it in chunks of this size
+HEAD_CHUNK_SIZE = 4096
+# Closing fence after a line break of any style (\n, \r\n or \r)
+FENCE_RE = re.compile(rb"[\r\n]---")
+
+
+def read_head(path: Path) -> str:
+    """Read a markdown file only as far as its closing frontmatter ``---``.
+
+    Files without frontmatter cost a single chunk read. Line endings are
+    normalized to ``\n`` as ``read_text()`` would, so CRLF files parse.
+    """
+    with path.open("rb") as f:
+        head = f.read(HEAD_CHUNK_SIZE)
+        if head.startswith((b"---\n", b"---\r")):
+            scanned = 4
+            while FENCE_RE.search(head, scanned) is None:
+                chunk = f.read(HEAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                scanned = max(4, len(head) - 3)
+                head += chunk
+    text = head.decode("utf-8", "ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
 
 def parse_frontmatter(content: str) -> Optional[dict]:
-    """Parse YAML frontmatter from markdown file."""
-    if not content.startswith("---"):
+    """Parse YAML frontmatter from markdown file.
+
+    Scans only up to the closing ``---`` instead of splitting the whole file.
+    """
+    if not content.startswith("---\n"):
         return None
-    match = re.search(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    end = content.find("\n---", 4)
+    if end == -1:
         return None
     fm = {}
-    for line in match.group(1).split("\n"):
-        if ":" in line:
-            k, v = line.split(":", 1)
+    for line in content[4:end].split("\n"):
+        k, sep, v = line.partition(":")
+        if sep:
             fm[k.strip()] = v.strip()
     return fm
 
 
-def validate_agents() -> list[str]:
+def load_frontmatter(path: Path) -> Optional[dict]:
+    """Read and parse one file's frontmatter."""
+    return parse_frontmatter(read_head(path))
+
+
+def validate_agents(pool: Executor) -> list[str]:
     """Validate agent files."""
     errors = []
     if not AGENTS_DIR.exists():
         return errors
 
-    for f in AGENTS_DIR.glob("*.md"):
-        content = f.read_text()
-        fm = parse_frontmatter(content)
+    files = list(AGENTS_DIR.glob("*.md"))
+    for f, fm in zip(files, pool.map(load_frontmatter, files)):
         name = f.stem
 
         if not fm:
@@ -56,25 +89,25 @@ def validate_agents() -> list[str]:
     return errors
 
 
-def validate_skills() -> list[str]:
+def validate_skills(pool: Executor) -> list[str]:
     """Validate skill directories."""
     errors = []
     if not SKILLS_DIR.exists():
         return errors
 
+    skill_files = []
     for skill_dir in SKILLS_DIR.iterdir():
         if not skill_dir.is_dir():
             continue
 
         skill_file = skill_dir / "SKILL.md"
-        name = skill_dir.name
-
         if not skill_file.exists():
-            errors.append(f"skill/{name}/: missing SKILL.md")
+            errors.append(f"skill/{skill_dir.name}/: missing SKILL.md")
             continue
+        skill_files.append(skill_file)
 
-        content = skill_file.read_text()
-        fm = parse_frontmatter(content)
+    for skill_file, fm in zip(skill_files, pool.map(load_frontmatter, skill_files)):
+        name = skill_file.parent.name
 
         if not fm:
             errors.append(f"skill/{name}/SKILL.md: missing frontmatter")
@@ -91,16 +124,14 @@ def validate_skills() -> list[str]:
     return errors
 
 
-def validate_commands() -> list[str]:
+def validate_commands(pool: Executor) -> list[str]:
     """Validate command files."""
     errors = []
     if not COMMANDS_DIR.exists():
         return errors
 
-    for f in COMMANDS_DIR.glob("*.md"):
-        content = f.read_text()
-        fm = parse_frontmatter(content)
-
+    files = list(COMMANDS_DIR.glob("*.md"))
+    for f, fm in zip(files, pool.map(load_frontmatter, files)):
         if not fm:
             errors.append(f"command/{f.name}: missing frontmatter")
             continue
@@ -113,9 +144,11 @@ def validate_commands() -> list[str]:
 
 def main():
     errors = []
-    errors.extend(validate_agents())
-    errors.extend(validate_skills())
-    errors.extend(validate_commands())
+    # File reads release the GIL; overlap them across threads
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        errors.extend(validate_agents(pool))
+        errors.extend(validate_skills(pool))
+        errors.extend(validate_commands(pool))
 
     if errors:
         msg = "⚠️ .claude/ validation errors:\n• " + "\n• ".join(errors)
@@ -1,9 +1,5 @@
 import yargs from 'yargs';
 import { hideBin } from 'yargs/helpers';
-import { cmdInit } from './commands/init.js';
-import { cmdUpdate } from './commands/update.js';
-import { cmdPullManifest } from './commands/pull-manifest.js';
-import { cmdPush } from './commands/push.js';
 import { checkGitInstalled } from './lib/git.js';
 import { createRequire } from 'module';
 
@@ -11,6 +7,9 @@ const require = createRequire(import.meta.url);
 const pkg = require('../package.json');
 const VERSION = pkg.version;
 
+// Command modules are imported inside their handlers so only the
+// selected command is loaded (--help/--version load none).
+
 async function main() {
   // Check dependencies
   if (!checkGitInstalled()) {
@@ -40,6 +39,7 @@ async function main() {
           });
       },
       async (argv) => {
+        const { cmdInit } = await import('./commands/init.js');
         const code = await cmdInit(argv.target as string, argv.yes as boolean);
         process.exit(code);
       }
@@ -56,6 +56,7 @@ async function main() {
         });
       },
       async (argv) => {
+        const { cmdUpdate } = await import('./commands/update.js');
         const code = await cmdUpdate(argv.yes as boolean);
         process.exit(code);
       }
@@ -65,6 +66,7 @@ async function main() {
       'Create sync config for push customization',
       () => {},
       async () => {
+        const { cmdPullManifest } = await import('./commands/pull-manifest.js');
         const code = await cmdPullManifest();
         process.exit(code);
       }
@@ -103,6 +105,7 @@ async function main() {
           });
       },
       async (argv) => {
+        const { cmdPush } = await import('./commands/push.js');
         const code = await cmdPush(
           argv.include as string[],
           argv.exclude as string[],
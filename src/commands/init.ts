@@ -1,11 +1,13 @@
-import { appendFileSync, copyFileSync, existsSync, mkdirSync, readFileSync, renameSync, writeFileSync } from 'fs';
+import { appendFileSync, constants, existsSync, mkdirSync, readFileSync, renameSync, writeFileSync } from 'fs';
+import { copyFile } from 'fs/promises';
 import { homedir } from 'os';
 import { basename, dirname, join, resolve } from 'path';
 import { isGitRepo } from '../lib/git.js';
-import { Manifest, filesAreDifferent } from '../lib/manifest.js';
+import { Manifest, comparePairs, filesAreDifferent } from '../lib/manifest.js';
+import { findExistingPaths } from '../lib/fs-utils.js';
 import { getAllhandsRoot } from '../lib/paths.js';
 import { ConflictResolution, askConflictResolution, confirm, getNextBackupPath } from '../lib/ui.js';
-import { SYNC_CONFIG_FILENAME, SYNC_CONFIG_TEMPLATE } from '../lib/constants.js';
+import { PROJECT_SPECIFIC_FILES, SYNC_CONFIG_FILENAME, SYNC_CONFIG_TEMPLATE } from '../lib/constants.js';
 import { restoreDotfiles } from '../lib/dotfiles.js';
 
 const ENVOY_SHELL_FUNCTION = `
@@ -83,28 +85,40 @@ export async function cmdInit(target: string, autoYes: boolean = false): Promise
   // Get distributable files
   const distributable = manifest.getDistributableFiles();
 
-  // Project-specific files: never overwrite if they exist
-  const projectSpecificFiles = new Set(['CLAUDE.project.md', '.claude/settings.local.json']);
+  // One directory listing per target dir instead of an existsSync per file
+  const existingTargets = findExistingPaths(resolvedTarget, distributable);
 
   // Detect conflicts (files that exist and differ)
   const conflicts: string[] = [];
+  // Comparison results by path, reused by the copy pass instead of re-reading both files
+  const differs = new Map<string, boolean>();
+  const compared: string[] = [];
+  const pairs: Array<[string, string]> = [];
 
   for (const relPath of distributable) {
     // Skip CLAUDE.md if we just migrated (it won't exist anymore)
     if (relPath === 'CLAUDE.md' && claudeMdMigrated) continue;
     // Skip project-specific files if they already exist (preserve user's content)
-    if (projectSpecificFiles.has(relPath) && existsSync(join(resolvedTarget, relPath))) continue;
+    if (PROJECT_SPECIFIC_FILES.has(relPath) && existingTargets.has(relPath)) continue;
 
     const sourceFile = join(allhandsRoot, relPath);
     const targetFile = join(resolvedTarget, relPath);
 
-    if (existsSync(targetFile) && existsSync(sourceFile)) {
-      if (filesAreDifferent(sourceFile, targetFile)) {
-        conflicts.push(relPath);
-      }
+    if (existingTargets.has(relPath) && existsSync(sourceFile)) {
+      compared.push(relPath);
+      pairs.push([sourceFile, targetFile]);
     }
   }
 
+  // Compare all existing targets concurrently, then record results in distributable order
+  const results = await comparePairs(pairs);
+  compared.forEach((relPath, i) => {
+    differs.set(relPath, results[i]);
+    if (results[i]) {
+      conflicts.push(relPath);
+    }
+  });
+
   // Handle conflicts
   let resolution: ConflictResolution = 'overwrite';
 
@@ -126,7 +140,8 @@ export async function cmdInit(target: string, autoYes: boolean = false): Promise
       for (const relPath of conflicts) {
         const targetFile = join(resolvedTarget, relPath);
         const backupPath = getNextBackupPath(targetFile);
-        copyFileSync(targetFile, backupPath);
+        // Target is overwritten by the copy pass below, so move rather than copy it
+        renameSync(targetFile, backupPath);
         console.log(`  ${relPath} → ${basename(backupPath)}`);
       }
     }
@@ -136,37 +151,46 @@ export async function cmdInit(target: string, autoYes: boolean = false): Promise
   console.log('\nCopying allhands files...');
   console.log(`Found ${distributable.size} files to distribute`);
 
-  let copied = 0;
   let skipped = 0;
+  const createdDirs = new Set<string>();
+  const pendingCopies: [string, string][] = [];
 
   for (const relPath of [...distributable].sort()) {
     const sourceFile = join(allhandsRoot, relPath);
     const targetFile = join(resolvedTarget, relPath);
 
     // Skip project-specific files if they already exist (preserve user's content)
-    if (projectSpecificFiles.has(relPath) && existsSync(targetFile)) {
+    if (PROJECT_SPECIFIC_FILES.has(relPath) && existingTargets.has(relPath)) {
       skipped++;
       continue;
     }
 
     if (!existsSync(sourceFile)) continue;
 
-    mkdirSync(dirname(targetFile), { recursive: true });
+    const targetDir = dirname(targetFile);
+    if (!createdDirs.has(targetDir)) {
+      mkdirSync(targetDir, { recursive: true });
+      createdDirs.add(targetDir);
+    }
 
-    if (existsSync(targetFile)) {
-      if (!filesAreDifferent(sourceFile, targetFile)) {
+    if (existingTargets.has(relPath)) {
+      if (!(differs.get(relPath) ?? filesAreDifferent(sourceFile, targetFile))) {
         skipped++;
         continue;
       }
     }
 
-    copyFileSync(sourceFile, targetFile);
-    copied++;
+    pendingCopies.push([sourceFile, targetFile]);
   }
 
+  // Copies are independent; issue them together so libuv's thread pool overlaps the I/O
+  // Reflink where the filesystem supports it (btrfs, XFS, APFS); plain copy otherwise
+  await Promise.all(pendingCopies.map(([src, dest]) => copyFile(src, dest, constants.COPYFILE_FICLONE)));
+  const copied = pendingCopies.length;
+
   // Restore dotfiles (gitignore → .gitignore, etc.)
   // npm excludes these files, so we ship them without dots and rename here
-  restoreDotfiles(resolvedTarget);
+  restoreDotfiles(resolvedTarget, distributable);
 
   // Setup envoy shell function
   console.log('\nSetting up envoy shell command...');
@@ -1,11 +1,11 @@
-import { copyFileSync, existsSync, mkdirSync, readFileSync, rmSync } from 'fs';
+import { constants, copyFileSync, existsSync, mkdirSync, readFileSync, rmSync } from 'fs';
 import { tmpdir } from 'os';
 import { dirname, join } from 'path';
-import { minimatch } from 'minimatch';
+import { Minimatch } from 'minimatch';
 import * as readline from 'readline';
 import { git, isGitRepo, getGitFiles } from '../lib/git.js';
 import { checkGhAuth, checkGhInstalled, getGhUser, gh } from '../lib/gh.js';
-import { Manifest, filesAreDifferent } from '../lib/manifest.js';
+import { Manifest, comparePairs, filesAreDifferent } from '../lib/manifest.js';
 import { getAllhandsRoot, UPSTREAM_REPO } from '../lib/paths.js';
 import { askQuestion, confirm } from '../lib/ui.js';
 import { PUSH_BLOCKLIST, SYNC_CONFIG_FILENAME } from '../lib/constants.js';
@@ -38,9 +38,38 @@ function loadSyncConfig(cwd: string): SyncConfig | null {
   }
 }
 
-function expandGlob(pattern: string, baseDir: string): string[] {
-  const allFiles = getGitFiles(baseDir);
-  return allFiles.filter((relPath) => minimatch(relPath, pattern, { dot: true }));
+/**
+ * Compile glob patterns into one predicate. Plain patterns are merged into a
+ * single alternation regex so each path is tested once. Negated patterns, and
+ * patterns whose regex carries flags a merged source would lose, keep their
+ * own matcher.
+ */
+function compileGlobs(patterns: string[]): (path: string) => boolean {
+  const sources: string[] = [];
+  const separate: Minimatch[] = [];
+  for (const pattern of patterns) {
+    const matcher = new Minimatch(pattern, { dot: true });
+    if (matcher.negate) {
+      separate.push(matcher);
+      continue;
+    }
+    const re = matcher.makeRe();
+    if (!re) {
+      continue;
+    }
+    if (re.flags === '') {
+      sources.push(re.source);
+    } else {
+      separate.push(matcher);
+    }
+  }
+  const union = sources.length > 0 ? new RegExp(sources.join('|')) : null;
+  return (path) => (union?.test(path) ?? false) || separate.some((matcher) => matcher.match(path));
+}
+
+function expandGlob(pattern: string, allFiles: string[]): string[] {
+  const matcher = new Minimatch(pattern, { dot: true });
+  return allFiles.filter((relPath) => matcher.match(relPath));
 }
 
 async function askMultiLineInput(prompt: string): Promise<string> {
@@ -69,7 +98,7 @@ async function askMultiLineInput(prompt: string): Promise<string> {
   });
 }
 
-function checkPrerequisites(cwd: string): PrerequisiteResult {
+function checkPrerequisites(): PrerequisiteResult {
   if (!checkGhInstalled()) {
     console.error('Error: gh CLI required. Install: https://cli.github.com');
     return { success: false };
@@ -80,11 +109,6 @@ function checkPrerequisites(cwd: string): PrerequisiteResult {
     return { success: false };
   }
 
-  if (!isGitRepo(cwd)) {
-    console.error('Error: Not in a git repository');
-    return { success: false };
-  }
-
   const ghUser = getGhUser();
   if (!ghUser) {
     console.error('Error: Could not determine GitHub username');
@@ -94,24 +118,30 @@ function checkPrerequisites(cwd: string): PrerequisiteResult {
   return { success: true, ghUser };
 }
 
-function collectFilesToPush(
+async function collectFilesToPush(
   cwd: string,
   finalIncludes: string[],
   finalExcludes: string[]
-): FileEntry[] {
+): Promise<FileEntry[]> {
   const allhandsRoot = getAllhandsRoot();
   const manifest = new Manifest(allhandsRoot);
   const upstreamFiles = manifest.getDistributableFiles();
   const filesToPush: FileEntry[] = [];
+  const candidates: string[] = [];
+  const pairs: Array<[string, string]> = [];
+  const isExcluded = compileGlobs(finalExcludes);
 
-  // Get non-ignored files in user's repo (respects .gitignore)
-  const localGitFiles = new Set(getGitFiles(cwd));
+  // Get non-ignored files in user's repo (respects .gitignore); listed once, reused for includes.
+  // Without includes only upstream paths matter, so git only scans their top-level entries.
+  const topLevel = new Set([...upstreamFiles].map((relPath) => relPath.split('/', 1)[0]));
+  const gitFiles = getGitFiles(cwd, finalIncludes.length > 0 ? [] : [...topLevel]);
+  const localGitFiles = new Set(gitFiles);
 
   for (const relPath of upstreamFiles) {
-    if (PUSH_BLOCKLIST.includes(relPath)) {
+    if (PUSH_BLOCKLIST.has(relPath)) {
       continue;
     }
-    if (finalExcludes.some((pattern) => minimatch(relPath, pattern, { dot: true }))) {
+    if (isExcluded(relPath)) {
       continue;
     }
     // Skip files that are gitignored in user's repo
@@ -120,19 +150,29 @@ function collectFilesToPush(
     }
 
     const localFile = join(cwd, relPath);
-    const upstreamFile = join(allhandsRoot, relPath);
+    if (existsSync(localFile)) {
+      candidates.push(relPath);
+      pairs.push([localFile, join(allhandsRoot, relPath)]);
+    }
+  }
 
-    if (existsSync(localFile) && filesAreDifferent(localFile, upstreamFile)) {
+  // Compare candidates concurrently; results come back in candidate order
+  const results = await comparePairs(pairs);
+  candidates.forEach((relPath, i) => {
+    if (results[i]) {
       filesToPush.push({ path: relPath, type: 'M' });
     }
-  }
+  });
+  // Paths already decided; include patterns often overlap, so each path is examined once
+  const seen = new Set(filesToPush.map((f) => f.path));
 
   for (const pattern of finalIncludes) {
-    const matchedFiles = expandGlob(pattern, cwd);
+    const matchedFiles = expandGlob(pattern, gitFiles);
     for (const relPath of matchedFiles) {
-      if (PUSH_BLOCKLIST.includes(relPath)) continue;
-      if (finalExcludes.some((p) => minimatch(relPath, p, { dot: true }))) continue;
-      if (filesToPush.some((f) => f.path === relPath)) continue;
+      if (PUSH_BLOCKLIST.has(relPath)) continue;
+      if (isExcluded(relPath)) continue;
+      if (seen.has(relPath)) continue;
+      seen.add(relPath);
 
       const localFile = join(cwd, relPath);
       const upstreamFile = join(allhandsRoot, relPath);
@@ -149,11 +189,15 @@ function collectFilesToPush(
   return filesToPush;
 }
 
+function forkExists(ghUser: string, repoName: string): boolean {
+  return gh(['repo', 'view', `${ghUser}/${repoName}`, '--json', 'name']).success;
+}
+
 async function waitForFork(ghUser: string, repoName: string): Promise<boolean> {
   console.log('Waiting for fork to be ready...');
   for (let i = 0; i < 15; i++) {
     await new Promise((r) => setTimeout(r, 2000));
-    if (gh(['repo', 'view', `${ghUser}/${repoName}`, '--json', 'name']).success) {
+    if (forkExists(ghUser, repoName)) {
       return true;
     }
   }
@@ -168,15 +212,16 @@ async function createPullRequest(
   body: string
 ): Promise<number> {
   const repoName = UPSTREAM_REPO.split('/')[1];
-  const forkCheck = gh(['repo', 'view', `${ghUser}/${repoName}`, '--json', 'name']);
 
-  if (!forkCheck.success) {
-    console.log('Creating fork...');
-    const forkResult = gh(['repo', 'fork', UPSTREAM_REPO, '--clone=false']);
+  // `gh repo fork` is a no-op for an existing fork; decide from its exit status and a
+  // follow-up view rather than its output wording. A failed fork call is fine if the fork exists.
+  const forkResult = gh(['repo', 'fork', UPSTREAM_REPO, '--clone=false']);
+  if (!forkExists(ghUser, repoName)) {
     if (!forkResult.success) {
       console.error('Error creating fork:', forkResult.stderr);
       return 1;
     }
+    console.log('Created fork.');
     if (!(await waitForFork(ghUser, repoName))) {
       console.error('Error: Timed out waiting for fork to be ready.');
       return 1;
@@ -195,13 +240,11 @@ async function createPullRequest(
     }
 
     console.log('Fetching upstream...');
-    const addRemoteResult = git(['remote', 'add', 'upstream', `https://github.com/${UPSTREAM_REPO}`], tempDir);
-    if (!addRemoteResult.success) {
-      console.error('Error adding upstream remote:', addRemoteResult.stderr);
-      return 1;
-    }
-
-    const fetchResult = git(['fetch', 'upstream', 'main', '--depth=1'], tempDir);
+    // Fetch by URL straight into the upstream tracking ref; no remote config needed for a one-off clone
+    const fetchResult = git(
+      ['fetch', '--depth=1', `https://github.com/${UPSTREAM_REPO}`, 'main:refs/remotes/upstream/main'],
+      tempDir
+    );
     if (!fetchResult.success) {
       console.error('Error fetching upstream:', fetchResult.stderr);
       return 1;
@@ -221,7 +264,7 @@ async function createPullRequest(
       const src = join(cwd, file.path);
       const dest = join(tempDir, file.path);
       mkdirSync(dirname(dest), { recursive: true });
-      copyFileSync(src, dest);
+      copyFileSync(src, dest, constants.COPYFILE_FICLONE);
     }
 
     const addResult = git(['add', '.'], tempDir);
@@ -280,11 +323,10 @@ export async function cmdPush(
 ): Promise<number> {
   const cwd = process.cwd();
 
-  const prereqs = checkPrerequisites(cwd);
-  if (!prereqs.success) {
+  if (!isGitRepo(cwd)) {
+    console.error('Error: Not in a git repository');
     return 1;
   }
-  const ghUser = prereqs.ghUser!;
 
   let syncConfig: SyncConfig | null = null;
   try {
@@ -296,20 +338,29 @@ export async function cmdPush(
   const finalIncludes = include.length > 0 ? include : (syncConfig?.includes || []);
   const finalExcludes = exclude.length > 0 ? exclude : (syncConfig?.excludes || []);
 
-  const filesToPush = collectFilesToPush(cwd, finalIncludes, finalExcludes);
+  const filesToPush = await collectFilesToPush(cwd, finalIncludes, finalExcludes);
 
   if (filesToPush.length === 0) {
     console.log('No changes to push');
     return 0;
   }
 
-  console.log('\nFiles to be included in PR:');
-  for (const file of filesToPush.sort((a, b) => a.path.localeCompare(b.path))) {
-    const marker = file.type === 'M' ? 'M' : 'A';
-    const label = file.type === 'M' ? 'modified' : 'included';
-    console.log(`  ${marker} ${file.path} (${label})`);
+  // gh checks hit the network, so they run only once there is something to push
+  const prereqs = checkPrerequisites();
+  if (!prereqs.success) {
+    return 1;
   }
-  console.log();
+  const ghUser = prereqs.ghUser!;
+
+  // Print the listing in one write rather than one console.log per file
+  const listing = filesToPush
+    .sort((a, b) => a.path.localeCompare(b.path))
+    .map((file) => {
+      const marker = file.type === 'M' ? 'M' : 'A';
+      const label = file.type === 'M' ? 'modified' : 'included';
+      return `  ${marker} ${file.path} (${label})`;
+    });
+  console.log(`\nFiles to be included in PR:\n${listing.join('\n')}\n`);
 
   if (dryRun) {
     console.log('Dry run - no PR created');
@@ -1,10 +1,11 @@
-import { existsSync, mkdirSync, copyFileSync, unlinkSync, renameSync } from 'fs';
+import { constants, existsSync, mkdirSync, copyFileSync, unlinkSync, renameSync } from 'fs';
 import { join, dirname, basename } from 'path';
-import { Manifest, filesAreDifferent } from '../lib/manifest.js';
+import { Manifest, comparePairs } from '../lib/manifest.js';
 import { isGitRepo, getStagedFiles } from '../lib/git.js';
 import { getAllhandsRoot } from '../lib/paths.js';
 import { ConflictResolution, askConflictResolution, confirm, getNextBackupPath } from '../lib/ui.js';
 import { restoreDotfiles } from '../lib/dotfiles.js';
+import { PROJECT_SPECIFIC_FILES } from '../lib/constants.js';
 
 export async function cmdUpdate(autoYes: boolean = false): Promise<number> {
   const targetRoot = process.cwd();
@@ -30,14 +31,11 @@ export async function cmdUpdate(autoYes: boolean = false): Promise<number> {
   // Check for staged changes to managed files
   const staged = getStagedFiles(targetRoot);
   const distributable = manifest.getDistributableFiles();
-  const managedPaths = new Set(distributable);
 
-  const stagedConflicts = [...staged].filter(f => managedPaths.has(f));
+  const stagedConflicts = [...staged].filter(f => distributable.has(f));
   if (stagedConflicts.length > 0) {
     console.error('Error: Staged changes detected in managed files:');
-    for (const f of stagedConflicts.sort()) {
-      console.error(`  - ${f}`);
-    }
+    console.error(stagedConflicts.sort().map((f) => `  - ${f}`).join('\n'));
     console.error("\nRun 'git stash' or commit first.");
     return 1;
   }
@@ -61,15 +59,13 @@ export async function cmdUpdate(autoYes: boolean = false): Promise<number> {
   // Detect conflicts and deleted files
   const conflicts: string[] = [];
   const deletedInSource: string[] = [];
-
-  // Project-specific files to always preserve
-  const projectSpecificFiles = new Set(['CLAUDE.project.md', '.claude/settings.local.json']);
+  const toCreate: string[] = [];
+  const compared: string[] = [];
+  const pairs: Array<[string, string]> = [];
 
   for (const relPath of distributable) {
-    // Skip CLAUDE.md if we just migrated
-    if (relPath === 'CLAUDE.md' && claudeMdMigrated) continue;
     // Skip project-specific files (always preserve user's version)
-    if (projectSpecificFiles.has(relPath)) continue;
+    if (PROJECT_SPECIFIC_FILES.has(relPath)) continue;
 
     const sourceFile = join(allhandsRoot, relPath);
     const targetFile = join(targetRoot, relPath);
@@ -82,12 +78,22 @@ export async function cmdUpdate(autoYes: boolean = false): Promise<number> {
     }
 
     if (existsSync(targetFile)) {
-      if (filesAreDifferent(sourceFile, targetFile)) {
-        conflicts.push(relPath);
-      }
+      compared.push(relPath);
+      pairs.push([sourceFile, targetFile]);
+    } else {
+      // Includes CLAUDE.md after a migration, since its target was just renamed away
+      toCreate.push(relPath);
     }
   }
 
+  // Compare all existing targets concurrently, then record results in distributable order
+  const results = await comparePairs(pairs);
+  compared.forEach((relPath, i) => {
+    if (results[i]) {
+      conflicts.push(relPath);
+    }
+  });
+
   // Handle conflicts
   let resolution: ConflictResolution = 'overwrite';
 
@@ -109,47 +115,37 @@ export async function cmdUpdate(autoYes: boolean = false): Promise<number> {
       for (const relPath of conflicts) {
         const targetFile = join(targetRoot, relPath);
         const backupPath = getNextBackupPath(targetFile);
-        copyFileSync(targetFile, backupPath);
+        // Target is overwritten by the copy pass below, so move rather than copy it
+        renameSync(targetFile, backupPath);
         console.log(`  ${relPath} → ${basename(backupPath)}`);
       }
     }
   }
 
-  // Copy updated files
-  let updated = 0;
-  let created = 0;
-
-  for (const relPath of [...distributable].sort()) {
-    // Skip project-specific files
-    if (projectSpecificFiles.has(relPath)) continue;
-
-    const sourceFile = join(allhandsRoot, relPath);
-    const targetFile = join(targetRoot, relPath);
-
-    if (!existsSync(sourceFile)) continue;
-
-    mkdirSync(dirname(targetFile), { recursive: true });
-
-    if (existsSync(targetFile)) {
-      if (filesAreDifferent(sourceFile, targetFile)) {
-        copyFileSync(sourceFile, targetFile);
-        updated++;
-      }
-    } else {
-      copyFileSync(sourceFile, targetFile);
-      created++;
+  // Copy only what changed: differing targets are updated, missing ones created.
+  // Unchanged files were already ruled out above, so nothing is compared twice.
+  const createdDirs = new Set<string>();
+  for (const relPath of toCreate) {
+    const targetDir = dirname(join(targetRoot, relPath));
+    if (!createdDirs.has(targetDir)) {
+      mkdirSync(targetDir, { recursive: true });
+      createdDirs.add(targetDir);
     }
   }
+  for (const relPath of [...conflicts, ...toCreate]) {
+    // Reflink where the filesystem supports it (btrfs, XFS, APFS); plain copy otherwise
+    copyFileSync(join(allhandsRoot, relPath), join(targetRoot, relPath), constants.COPYFILE_FICLONE);
+  }
+  const updated = conflicts.length;
+  const created = toCreate.length;
 
   // Restore dotfiles (gitignore → .gitignore, etc.)
-  restoreDotfiles(targetRoot);
+  restoreDotfiles(targetRoot, distributable);
 
   // Handle deleted files
   if (deletedInSource.length > 0) {
     console.log(`\n${deletedInSource.length} files removed from allhands source:`);
-    for (const f of deletedInSource) {
-      console.log(`  - ${f}`);
-    }
+    console.log(deletedInSource.map((f) => `  - ${f}`).join('\n'));
     const shouldDelete = autoYes || (await confirm('Delete these from target?'));
     if (shouldDelete) {
       for (const f of deletedInSource) {
@@ -1,7 +1,13 @@
 export const SYNC_CONFIG_FILENAME = '.allhands-sync-config.json';
 
 // Files that should never be pushed back to upstream
-export const PUSH_BLOCKLIST = ['CLAUDE.project.md', '.allhands-sync-config.json'];
+export const PUSH_BLOCKLIST: ReadonlySet<string> = new Set(['CLAUDE.project.md', '.allhands-sync-config.json']);
+
+// Project-specific files: never overwritten in a target repo once they exist
+export const PROJECT_SPECIFIC_FILES: ReadonlySet<string> = new Set([
+  'CLAUDE.project.md',
+  '.claude/settings.local.json',
+]);
 
 export const SYNC_CONFIG_TEMPLATE = {
   $comment: 'Customization for claude-all-hands push command',
@@ -1,6 +1,5 @@
 import { existsSync, renameSync } from 'fs';
 import { basename, dirname, join } from 'path';
-import { walkDir } from './fs-utils.js';
 
 // Files that npm hardcode-excludes and we rename for packaging
 const DOTFILE_NAMES = ['gitignore', 'npmrc', 'npmignore'];
@@ -8,29 +7,34 @@ const DOTFILE_NAMES = ['gitignore', 'npmrc', 'npmignore'];
 /**
  * Restore dotfiles after copying from npm package.
  * Renames `gitignore` → `.gitignore`, `npmrc` → `.npmrc`, etc.
+ * Only the given distributed paths are checked, so the rest of the
+ * target repo is never walked.
  * Returns count of files renamed.
  */
-export function restoreDotfiles(targetDir: string): { renamed: string[]; skipped: string[] } {
+export function restoreDotfiles(
+  targetDir: string,
+  relPaths: Iterable<string>
+): { renamed: string[]; skipped: string[] } {
   const renamed: string[] = [];
   const skipped: string[] = [];
 
-  walkDir(targetDir, (filePath) => {
-    const name = basename(filePath);
+  for (const relPath of relPaths) {
+    const name = basename(relPath);
+    if (!DOTFILE_NAMES.includes(name)) continue;
 
-    if (DOTFILE_NAMES.includes(name)) {
-      const dir = dirname(filePath);
-      const dotName = '.' + name;
-      const dotPath = join(dir, dotName);
+    const filePath = join(targetDir, relPath);
+    if (!existsSync(filePath)) continue;
 
-      if (existsSync(dotPath)) {
-        // Target dotfile already exists - skip to avoid overwriting
-        skipped.push(filePath);
-      } else {
-        renameSync(filePath, dotPath);
-        renamed.push(filePath);
-      }
+    const dotPath = join(dirname(filePath), '.' + name);
+
+    if (existsSync(dotPath)) {
+      // Target dotfile already exists - skip to avoid overwriting
+      skipped.push(filePath);
+    } else {
+      renameSync(filePath, dotPath);
+      renamed.push(filePath);
     }
-  });
+  }
 
   return { renamed, skipped };
 }
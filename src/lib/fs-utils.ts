@@ -1,18 +1,37 @@
 import { existsSync, readdirSync } from 'fs';
-import { join } from 'path';
+import { basename, dirname, join } from 'path';
 
-export function walkDir(dir: string, callback: (filePath: string) => void): void {
-  if (!existsSync(dir)) return;
-  const entries = readdirSync(dir, { withFileTypes: true });
-  for (const entry of entries) {
-    if (entry.name === '.git' || entry.name === 'node_modules') {
-      continue;
+/**
+ * Find which root-relative paths exist, listing each parent directory once
+ * instead of stat-ing every path. Names the listing doesn't contain exactly
+ * are confirmed with existsSync, so case-insensitive filesystems (where an
+ * existing `claude.md` satisfies `CLAUDE.md`) are still detected.
+ */
+export function findExistingPaths(root: string, relPaths: Iterable<string>): Set<string> {
+  const byDir = new Map<string, string[]>();
+  for (const relPath of relPaths) {
+    const dir = dirname(relPath);
+    const paths = byDir.get(dir);
+    if (paths) {
+      paths.push(relPath);
+    } else {
+      byDir.set(dir, [relPath]);
     }
-    const fullPath = join(dir, entry.name);
-    if (entry.isDirectory()) {
-      walkDir(fullPath, callback);
-    } else if (entry.isFile()) {
-      callback(fullPath);
+  }
+
+  const existing = new Set<string>();
+  for (const [dir, paths] of byDir) {
+    let names: Set<string>;
+    try {
+      names = new Set(readdirSync(join(root, dir)));
+    } catch {
+      continue; // Directory missing: none of its paths exist
+    }
+    for (const relPath of paths) {
+      if (names.has(basename(relPath)) || existsSync(join(root, relPath))) {
+        existing.add(relPath);
+      }
     }
   }
+  return existing;
 }
@@ -1,4 +1,4 @@
-import { execSync, spawnSync } from 'child_process';
+import { spawnSync } from 'child_process';
 
 export interface GhResult {
   success: boolean;
@@ -21,12 +21,8 @@ export function gh(args: string[], cwd?: string): GhResult {
 }
 
 export function checkGhInstalled(): boolean {
-  try {
-    execSync('gh --version', { stdio: 'ignore' });
-    return true;
-  } catch {
-    return false;
-  }
+  // Run gh directly; status is null when it isn't installed
+  return spawnSync('gh', ['--version'], { stdio: 'ignore' }).status === 0;
 }
 
 export function checkGhAuth(): boolean {
@@ -1,4 +1,4 @@
-import { execSync, spawnSync } from 'child_process';
+import { spawnSync } from 'child_process';
 
 export interface GitResult {
   success: boolean;
@@ -21,11 +21,12 @@ export function git(args: string[], cwd: string): GitResult {
 }
 
 export function getStagedFiles(repoPath: string): Set<string> {
-  const result = git(['diff', '--cached', '--name-only'], repoPath);
+  // -z emits raw NUL-separated paths, so unusual names are never quoted or escaped
+  const result = git(['diff', '--cached', '--name-only', '-z'], repoPath);
   if (!result.success || !result.stdout) {
     return new Set();
   }
-  return new Set(result.stdout.split('\n').filter(Boolean));
+  return new Set(result.stdout.split('\0').filter(Boolean));
 }
 
 export function isGitRepo(path: string): boolean {
@@ -34,30 +35,24 @@ export function isGitRepo(path: string): boolean {
 }
 
 export function checkGitInstalled(): boolean {
-  try {
-    execSync('git --version', { stdio: 'ignore' });
-    return true;
-  } catch {
-    return false;
-  }
+  // Run git directly; status is null when it isn't installed
+  return spawnSync('git', ['--version'], { stdio: 'ignore' }).status === 0;
 }
 
 /**
  * Get all files tracked by git plus untracked files, excluding gitignored files.
- * This respects .gitignore at all levels.
+ * This respects .gitignore at all levels. Optional pathspecs are matched literally.
  */
-export function getGitFiles(repoPath: string): string[] {
-  // Get tracked files
-  const tracked = git(['ls-files'], repoPath);
-  // Get untracked files that are NOT ignored
-  const untracked = git(['ls-files', '--others', '--exclude-standard'], repoPath);
-
-  const files: string[] = [];
-  if (tracked.success && tracked.stdout) {
-    files.push(...tracked.stdout.split('\n').filter(Boolean));
+export function getGitFiles(repoPath: string, pathspecs: string[] = []): string[] {
+  // Tracked plus untracked-but-not-ignored files, listed by a single git process.
+  // Pathspecs limit the listing (and git's untracked-file scan) to those paths.
+  const args = ['ls-files', '--cached', '--others', '--exclude-standard', '-z'];
+  if (pathspecs.length > 0) {
+    args.push('--', ...pathspecs.map((pathspec) => `:(literal)${pathspec}`));
   }
-  if (untracked.success && untracked.stdout) {
-    files.push(...untracked.stdout.split('\n').filter(Boolean));
+  const result = git(args, repoPath);
+  if (!result.success || !result.stdout) {
+    return [];
   }
-  return files;
+  return result.stdout.split('\0').filter(Boolean);
 }
@@ -1,45 +1,69 @@
-import { existsSync, readFileSync } from 'fs';
-import { join, relative, dirname } from 'path';
-import { minimatch } from 'minimatch';
-import { walkDir } from './fs-utils.js';
+import { existsSync, readdirSync, readFileSync } from 'fs';
+import { join } from 'path';
+import { Minimatch } from 'minimatch';
 
 interface GitignoreRule {
   pattern: string;
   negated: boolean;
   directory: string; // Directory where the .gitignore lives (relative to root)
+  matchers: Minimatch[]; // Compiled once at parse time, reused for every path
+}
+
+const MATCH_OPTIONS = { dot: true, matchBase: false };
+
+/**
+ * Compile a gitignore pattern into minimatch matchers for the pattern
+ * itself and for anything beneath it (directory matches).
+ */
+function compilePattern(pattern: string): Minimatch[] {
+  let matchPattern = pattern;
+
+  // Pattern starting with / means root-relative
+  if (pattern.startsWith('/')) {
+    matchPattern = pattern.slice(1);
+  }
+
+  // Pattern ending with / means directory only (we treat all as potential matches)
+  if (matchPattern.endsWith('/')) {
+    matchPattern = matchPattern.slice(0, -1) + '/**';
+  }
+
+  // If pattern has no slash, it can match at any level
+  // If pattern has slash (not just trailing), it's relative to gitignore location
+  const hasSlash = pattern.includes('/') && !pattern.endsWith('/');
+
+  if (!hasSlash && !pattern.startsWith('/')) {
+    // Match at any level: foo matches a/b/foo and foo
+    matchPattern = '**/' + matchPattern;
+  }
+
+  // Also match with ** suffix for directories
+  return [new Minimatch(matchPattern, MATCH_OPTIONS), new Minimatch(matchPattern + '/**', MATCH_OPTIONS)];
 }
 
 /**
  * Parse a single .gitignore file and return rules.
+ * Each line is trimmed once and classified by its first character.
  */
 function parseGitignoreFile(content: string, directory: string): GitignoreRule[] {
   const rules: GitignoreRule[] = [];
-  const lines = content.split('\n');
 
-  for (const line of lines) {
+  for (const line of content.split('\n')) {
     const trimmed = line.trim();
 
     // Skip empty lines and comments
-    if (!trimmed || trimmed.startsWith('#')) {
+    if (!trimmed || trimmed[0] === '#') {
       continue;
     }
 
-    let pattern = trimmed;
-    let negated = false;
-
     // Handle negation
-    if (pattern.startsWith('!')) {
-      negated = true;
-      pattern = pattern.slice(1);
-    }
-
-    // Remove trailing spaces (unless escaped)
-    pattern = pattern.replace(/(?<!\\)\s+$/, '');
+    const negated = trimmed[0] === '!';
+    const pattern = negated ? trimmed.slice(1) : trimmed;
 
     // Skip empty patterns after processing
     if (!pattern) continue;
 
-    rules.push({ pattern, negated, directory });
+    rules.push({ pattern, negated, directory, matchers: compilePattern(pattern) });
   }
 
   return rules;
@@ -50,7 +74,7 @@ function parseGitignoreFile(content: string, directory: string): GitignoreRule[]
  * Handles directory-relative patterns correctly.
  */
 function matchesPattern(filePath: string, rule: GitignoreRule): boolean {
-  const { pattern, directory } = rule;
+  const { directory } = rule;
 
   // Get the path relative to the gitignore's directory
   let relativePath = filePath;
@@ -62,41 +86,7 @@ function matchesPattern(filePath: string, rule: GitignoreRule): boolean {
     relativePath = filePath.slice(directory.length + 1);
   }
 
-  // Handle patterns that should only match from root of gitignore dir
-  let matchPattern = pattern;
-
-  // Pattern starting with / means root-relative
-  if (pattern.startsWith('/')) {
-    matchPattern = pattern.slice(1);
-  }
-
-  // Pattern ending with / means directory only (we treat all as potential matches)
-  if (matchPattern.endsWith('/')) {
-    matchPattern = matchPattern.slice(0, -1) + '/**';
-  }
-
-  // If pattern has no slash, it can match at any level
-  // If pattern has slash (not just trailing), it's relative to gitignore location
-  const hasSlash = pattern.includes('/') && !pattern.endsWith('/');
-
-  if (!hasSlash && !pattern.startsWith('/')) {
-    // Match at any level: foo matches a/b/foo and foo
-    matchPattern = '**/' + matchPattern;
-  }
-
-  // Try matching
-  const opts = { dot: true, matchBase: false };
-
-  if (minimatch(relativePath, matchPattern, opts)) {
-    return true;
-  }
-
-  // Also try with ** suffix for directories
-  if (minimatch(relativePath, matchPattern + '/**', opts)) {
-    return true;
-  }
-
-  return false;
+  return rule.matchers.some((matcher) => matcher.match(relativePath));
 }
 
 /**
@@ -105,6 +95,9 @@ function matchesPattern(filePath: string, rule: GitignoreRule): boolean {
 export class GitignoreFilter {
   private rules: GitignoreRule[] = [];
   private rootDir: string;
+  // Every file under rootDir (relative), recorded by the same walk that finds .gitignore files
+  private files: string[] = [];
+  private hasNegation = false;
 
   constructor(rootDir: string) {
     this.rootDir = rootDir;
@@ -112,56 +105,70 @@ export class GitignoreFilter {
   }
 
   /**
-   * Walk the directory tree and load all .gitignore files.
+   * Walk the directory tree once, loading all .gitignore files and
+   * recording every file path for getNonIgnoredFiles().
    */
   private loadGitignoreFiles(): void {
-    // Check root .gitignore
-    const rootGitignore = join(this.rootDir, '.gitignore');
-    if (existsSync(rootGitignore)) {
-      const content = readFileSync(rootGitignore, 'utf-8');
-      this.rules.push(...parseGitignoreFile(content, ''));
+    this.walk(this.rootDir, '');
+  }
+
+  /**
+   * Visit one directory: load its .gitignore before anything else, record
+   * its files, then descend into subdirectories that aren't ignored.
+   * Ignored subtrees (build output, caches, venvs) are never read.
+   */
+  private walk(dir: string, relDir: string): void {
+    if (!existsSync(dir)) return;
+    const entries = readdirSync(dir, { withFileTypes: true });
+
+    if (entries.some((entry) => entry.name === '.gitignore' && entry.isFile())) {
+      const content = readFileSync(join(dir, '.gitignore'), 'utf-8');
+      const rules = parseGitignoreFile(content, relDir);
+      this.rules.push(...rules);
+      this.hasNegation ||= rules.some((rule) => rule.negated);
     }
 
-    // Walk and find nested .gitignore files
-    walkDir(this.rootDir, (filePath) => {
-      const relativePath = relative(this.rootDir, filePath);
-      if (relativePath.endsWith('.gitignore') && relativePath !== '.gitignore') {
-        const content = readFileSync(filePath, 'utf-8');
-        const directory = dirname(relativePath);
-        this.rules.push(...parseGitignoreFile(content, directory));
+    const subdirs: string[] = [];
+    for (const entry of entries) {
+      if (entry.name === '.git' || entry.name === 'node_modules') {
+        continue;
+      }
+      const relativePath = relDir ? `${relDir}/${entry.name}` : entry.name;
+      if (entry.isDirectory()) {
+        subdirs.push(relativePath);
+      } else if (entry.isFile()) {
+        this.files.push(relativePath);
       }
-    });
+    }
+
+    for (const relativePath of subdirs) {
+      // Without negations, nothing under an ignored directory can be re-included
+      if (!this.hasNegation && this.isIgnored(`${relativePath}/`)) {
+        continue;
+      }
+      this.walk(join(this.rootDir, relativePath), relativePath);
+    }
   }
 
   /**
    * Check if a file should be ignored based on all gitignore rules.
    */
   isIgnored(filePath: string): boolean {
-    let ignored = false;
-
-    // Process rules in order - later rules can override earlier ones
-    for (const rule of this.rules) {
+    // Later rules override earlier ones, so the last matching rule decides
+    for (let i = this.rules.length - 1; i >= 0; i--) {
+      const rule = this.rules[i];
       if (matchesPattern(filePath, rule)) {
-        ignored = !rule.negated;
+        return !rule.negated;
       }
     }
 
-    return ignored;
+    return false;
   }
 
   /**
    * Get all non-ignored files from the directory tree.
    */
   getNonIgnoredFiles(): string[] {
-    const files: string[] = [];
-
-    walkDir(this.rootDir, (filePath) => {
-      const relativePath = relative(this.rootDir, filePath);
-      if (!this.isIgnored(relativePath)) {
-        files.push(relativePath);
-      }
-    });
-
-    return files;
+    return this.files.filter((relativePath) => !this.isIgnored(relativePath));
   }
 }
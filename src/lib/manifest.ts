@@ -1,6 +1,7 @@
-import { readFileSync, existsSync, statSync } from 'fs';
+import { closeSync, openSync, readFileSync, readSync, statSync } from 'fs';
 import { join } from 'path';
-import { minimatch } from 'minimatch';
+import { open, stat } from 'fs/promises';
+import { Minimatch } from 'minimatch';
 import { GitignoreFilter } from './gitignore.js';
 
 interface InternalData {
@@ -9,27 +10,125 @@ interface InternalData {
 
 const INTERNAL_FILENAME = '.internal.json';
 
+// Characters that make a path segment a glob rather than a literal name
+const GLOB_MAGIC = /[*?[\]{}()!+@\\]/;
+
+/**
+ * Compile patterns and bucket them by their literal first path segment.
+ * Patterns whose first segment is a glob go under '' and are checked for every path.
+ */
+function bucketByTopSegment(patterns: string[]): Map<string, Minimatch[]> {
+  const buckets = new Map<string, Minimatch[]>();
+  for (const pattern of patterns) {
+    const top = pattern.split('/', 1)[0];
+    const key = GLOB_MAGIC.test(top) || top === '.' || top === '..' ? '' : top;
+    const matcher = new Minimatch(pattern, { dot: true });
+    const bucket = buckets.get(key);
+    if (bucket) {
+      bucket.push(matcher);
+    } else {
+      buckets.set(key, [matcher]);
+    }
+  }
+  return buckets;
+}
+
+/**
+ * True if the pattern names one exact path: no glob characters, not a
+ * '#' comment, and no empty, '.' or '..' segments (which minimatch would normalize).
+ */
+function isLiteralPath(pattern: string): boolean {
+  return (
+    !GLOB_MAGIC.test(pattern) &&
+    !pattern.startsWith('#') &&
+    pattern.split('/').every((seg) => seg !== '' && seg !== '.' && seg !== '..')
+  );
+}
+
+interface InternalMatchers {
+  // Exact paths, e.g. 'package.json'
+  literals: Set<string>;
+  // Directories whose whole subtree matches ('dir/**'), stored with a trailing '/'
+  subtrees: Set<string>;
+  // Everything else, bucketed by top-level segment
+  globs: Map<string, Minimatch[]>;
+}
+
+/**
+ * Split patterns by shape so the common cases are plain set lookups and
+ * only true globs go through minimatch.
+ */
+function compileInternalPatterns(patterns: string[]): InternalMatchers {
+  const literals = new Set<string>();
+  const subtrees = new Set<string>();
+  const globPatterns: string[] = [];
+  for (const pattern of patterns) {
+    if (isLiteralPath(pattern)) {
+      literals.add(pattern);
+    } else if (pattern.endsWith('/**') && isLiteralPath(pattern.slice(0, -3))) {
+      subtrees.add(pattern.slice(0, -2));
+    } else {
+      globPatterns.push(pattern);
+    }
+  }
+  return { literals, subtrees, globs: bucketByTopSegment(globPatterns) };
+}
+
+/**
+ * Check each ancestor directory of the path ('a/', 'a/b/', ...) against the
+ * subtree set: one lookup per path depth, however many subtree patterns exist.
+ */
+function underAnySubtree(subtrees: Set<string>, path: string): boolean {
+  if (subtrees.size === 0) return false;
+  for (let i = path.indexOf('/'); i !== -1; i = path.indexOf('/', i + 1)) {
+    if (subtrees.has(path.slice(0, i + 1))) {
+      return true;
+    }
+  }
+  return false;
+}
+
+function matchesAny(matchers: Minimatch[] | undefined, path: string): boolean {
+  return matchers?.some(matcher => matcher.match(path)) ?? false;
+}
+
 export class Manifest {
   private allhandsRoot: string;
   private internalPath: string;
   private data: InternalData;
-  private gitignoreFilter: GitignoreFilter;
+  private gitignoreFilter?: GitignoreFilter;
+  private internalMatchers: InternalMatchers;
+  private distributable?: ReadonlySet<string>;
 
   constructor(allhandsRoot: string) {
     this.allhandsRoot = allhandsRoot;
     this.internalPath = join(allhandsRoot, INTERNAL_FILENAME);
     this.data = this.load();
-    this.gitignoreFilter = new GitignoreFilter(allhandsRoot);
+    this.internalMatchers = compileInternalPatterns(this.internalPatterns);
   }
 
   private load(): InternalData {
-    if (!existsSync(this.internalPath)) {
-      throw new Error(`Internal config not found: ${this.internalPath}`);
+    let content: string;
+    try {
+      content = readFileSync(this.internalPath, 'utf-8');
+    } catch (e) {
+      if ((e as NodeJS.ErrnoException).code === 'ENOENT') {
+        throw new Error(`Internal config not found: ${this.internalPath}`);
+      }
+      throw e;
     }
-    const content = readFileSync(this.internalPath, 'utf-8');
     return JSON.parse(content);
   }
 
+  /**
+   * Gitignore rules for the allhands tree. Built on first use, since the
+   * tree walk is the costly part and commands may exit before needing it.
+   */
+  private get gitignore(): GitignoreFilter {
+    this.gitignoreFilter ??= new GitignoreFilter(this.allhandsRoot);
+    return this.gitignoreFilter;
+  }
+
   get internalPatterns(): string[] {
     return this.data.internal || [];
   }
@@ -38,14 +137,20 @@ export class Manifest {
    * Check if a file is marked as internal (should not be distributed).
    */
   isInternal(path: string): boolean {
-    return this.internalPatterns.some(pattern => minimatch(path, pattern, { dot: true }));
+    const { literals, subtrees, globs } = this.internalMatchers;
+    if (literals.has(path) || underAnySubtree(subtrees, path)) {
+      return true;
+    }
+    // Only globs sharing the path's top-level segment (or starting with a glob) can match
+    const top = path.split('/', 1)[0];
+    return matchesAny(globs.get(top), path) || matchesAny(globs.get(''), path);
   }
 
   /**
    * Check if a file is gitignored.
    */
   isGitignored(path: string): boolean {
-    return this.gitignoreFilter.isIgnored(path);
+    return this.gitignore.isIgnored(path);
   }
 
   /**
@@ -59,9 +164,14 @@ export class Manifest {
   /**
    * Get all distributable files from the allhands root.
    * Returns files that are NOT internal AND NOT gitignored.
+   * Computed once per Manifest; later calls return the same set.
    */
-  getDistributableFiles(): Set<string> {
-    const allFiles = this.gitignoreFilter.getNonIgnoredFiles();
+  getDistributableFiles(): ReadonlySet<string> {
+    if (this.distributable) {
+      return this.distributable;
+    }
+
+    const allFiles = this.gitignore.getNonIgnoredFiles();
     const filtered = new Set<string>();
 
     for (const file of allFiles) {
@@ -70,27 +180,114 @@ export class Manifest {
       }
     }
 
+    this.distributable = filtered;
     return filtered;
   }
 }
 
 /**
  * Compare two files byte-by-byte.
+ * One stat per file doubles as the existence check and the size gate.
  */
 export function filesAreDifferent(file1: string, file2: string): boolean {
-  if (!existsSync(file1) || !existsSync(file2)) {
+  const stat1 = statSync(file1, { throwIfNoEntry: false });
+  const stat2 = statSync(file2, { throwIfNoEntry: false });
+
+  if (!stat1 || !stat2 || stat1.size !== stat2.size) {
     return true;
   }
 
-  const stat1 = statSync(file1);
-  const stat2 = statSync(file2);
+  // Two empty files are equal without opening either
+  return stat1.size > 0 && !contentsEqual(file1, file2, stat1.size);
+}
+
+// Chunk size for streaming comparisons of same-size files
+const COMPARE_CHUNK_SIZE = 64 * 1024;
+
+/**
+ * Compare two files of the given size in fixed-size chunks, stopping at the
+ * first differing chunk so neither file is ever fully buffered. The known size
+ * bounds the loop, so no trailing reads are spent discovering EOF.
+ */
+function contentsEqual(file1: string, file2: string, size: number): boolean {
+  const fd1 = openSync(file1, 'r');
+  try {
+    const fd2 = openSync(file2, 'r');
+    try {
+      const chunkSize = Math.min(size, COMPARE_CHUNK_SIZE);
+      const buf1 = Buffer.allocUnsafe(chunkSize);
+      const buf2 = Buffer.allocUnsafe(chunkSize);
+      for (let remaining = size; remaining > 0; ) {
+        const read1 = readSync(fd1, buf1, 0, chunkSize, null);
+        const read2 = readSync(fd2, buf2, 0, chunkSize, null);
+        // An empty read means a file shrank after it was stat'd
+        if (read1 === 0 || read1 !== read2 || buf1.compare(buf2, 0, read2, 0, read1) !== 0) {
+          return false;
+        }
+        remaining -= read1;
+      }
+      return true;
+    } finally {
+      closeSync(fd2);
+    }
+  } finally {
+    closeSync(fd1);
+  }
+}
+
+// Comparisons in flight at once; each holds two file descriptors open
+const COMPARE_CONCURRENCY = 16;
+
+/**
+ * Compare many [file1, file2] pairs concurrently, overlapping their I/O.
+ * Returns one filesAreDifferent result per pair, in input order.
+ */
+export async function comparePairs(pairs: Array<[string, string]>): Promise<boolean[]> {
+  const results: boolean[] = new Array(pairs.length);
+  let next = 0;
+  const worker = async (): Promise<void> => {
+    while (next < pairs.length) {
+      const i = next++;
+      results[i] = await filesAreDifferentAsync(pairs[i][0], pairs[i][1]);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(COMPARE_CONCURRENCY, pairs.length) }, worker));
+  return results;
+}
+
+async function filesAreDifferentAsync(file1: string, file2: string): Promise<boolean> {
+  const [stat1, stat2] = await Promise.all([stat(file1).catch(() => null), stat(file2).catch(() => null)]);
 
-  if (stat1.size !== stat2.size) {
+  if (!stat1 || !stat2 || stat1.size !== stat2.size) {
     return true;
   }
 
-  const content1 = readFileSync(file1);
-  const content2 = readFileSync(file2);
+  return stat1.size > 0 && !(await contentsEqualAsync(file1, file2, stat1.size));
+}
 
-  return !content1.equals(content2);
+async function contentsEqualAsync(file1: string, file2: string, size: number): Promise<boolean> {
+  const handle1 = await open(file1, 'r');
+  try {
+    const handle2 = await open(file2, 'r');
+    try {
+      const chunkSize = Math.min(size, COMPARE_CHUNK_SIZE);
+      const buf1 = Buffer.allocUnsafe(chunkSize);
+      const buf2 = Buffer.allocUnsafe(chunkSize);
+      for (let remaining = size; remaining > 0; ) {
+        const [{ bytesRead: read1 }, { bytesRead: read2 }] = await Promise.all([
+          handle1.read(buf1, 0, chunkSize, null),
+          handle2.read(buf2, 0, chunkSize, null),
+        ]);
+        if (read1 === 0 || read1 !== read2 || buf1.compare(buf2, 0, read2, 0, read1) !== 0) {
+          return false;
+        }
+        remaining -= read1;
+      }
+      return true;
+    } finally {
+      await handle2.close();
+    }
+  } finally {
+    await handle1.close();
+  }
 }